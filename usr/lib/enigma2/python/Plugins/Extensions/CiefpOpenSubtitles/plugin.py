@@ -6,12 +6,29 @@ import sys
 import re
 import json
 import time
+import functools
+import difflib
+import itertools
+import threading
+from collections import Counter, namedtuple
 import requests
+from io import BytesIO
+from zipfile import ZipFile
+from concurrent.futures import ThreadPoolExecutor
 from requests.adapters import HTTPAdapter
 from requests.packages.urllib3.util.retry import Retry
 from six.moves.urllib.parse import quote_plus, urlencode
 
+try:
+    # Opciono: C implementacija sličnosti stringova, višestruko brža od difflib
+    from rapidfuzz.fuzz import ratio as fuzz_ratio
+except ImportError:
+    fuzz_ratio = None
+
 from enigma import eTimer, getDesktop, gFont, eSize, ePoint, eServiceCenter
+from twisted.internet.defer import Deferred, DeferredList
+from twisted.python.failure import Failure
+from twisted.internet.threads import deferToThread
 from Components.MenuList import MenuList
 from Components.ActionMap import ActionMap, HelpableActionMap
 from Components.Button import Button
@@ -29,19 +46,236 @@ from Screens.MessageBox import MessageBox
 from Screens.ChoiceBox import ChoiceBox
 from Screens.VirtualKeyBoard import VirtualKeyBoard
 from Tools.BoundFunction import boundFunction
-from Tools.Directories import fileExists, pathExists, createDir, resolveFilename, SCOPE_PLUGINS
+from Tools.Directories import fileExists, pathExists, resolveFilename, SCOPE_PLUGINS
 
 # Versija plugina
 PLUGIN_VERSION = "1.4"  # TRI PRETRAGE: Standard, Smart, Advanced
 PLUGIN_PATH = resolveFilename(SCOPE_PLUGINS, "Extensions/CiefpOpenSubtitles/")
+ICON_PATH = os.path.join(PLUGIN_PATH, "icon.png")
+if not fileExists(ICON_PATH):
+    ICON_PATH = None
 CONFIG_DIR = "/etc/enigma2/ciefpopensubtitles/"
 
+# Detaljan log po stavci (CIEFP_DEBUG=1) - sumarni log se uvek ispisuje
+DEBUG = os.environ.get('CIEFP_DEBUG', '0') not in ('', '0')
+
 # Kreiraj config direktorijum ako ne postoji
-if not pathExists(CONFIG_DIR):
-    try:
-        createDir(CONFIG_DIR)
-    except:
-        CONFIG_DIR = "/tmp/ciefpopensubtitles/"
+try:
+    os.makedirs(CONFIG_DIR, exist_ok=True)
+except OSError:
+    CONFIG_DIR = "/tmp/ciefpopensubtitles/"
+
+# Mapiranje 3-slovnih kodova jezika za OpenSubtitles.com
+OPENSUBTITLES_LANG_MAP = {
+    'srp': 'sr', 'scc': 'sr', 'hrv': 'hr',
+    'bos': 'bs', 'eng': 'en', 'slv': 'sl'
+}
+
+# Keš SubDL pretrage (sekunde / broj upita)
+SUBDL_CACHE_TTL = 60
+SUBDL_CACHE_SIZE = 64
+
+# Keš objedinjenih rezultata pretrage (search_all / search_all_smart)
+RESULTS_CACHE_TTL = 600
+RESULTS_CACHE_SIZE = 64
+RESULTS_CACHE_FILE = "/tmp/ciefpopensubtitles_results.json"  # Preživi restart GUI-ja
+RESULTS_CACHE_SAVE_DELAY = 2.0  # Više upisa u kešu zaredom -> jedno snimanje fajla
+
+# Oznaka u nazivu sačuvanog titla: vreme učitavanja plugina + redni broj,
+# jedinstvena i rastuća i kad se više titlova snimi u istoj sekundi
+SAVE_BASE_TS = int(time.time())
+SAVE_COUNTER = itertools.count()
+
+# Znakovi koji se izbacuju iz naziva fajla titla
+FILENAME_STRIP_RE = re.compile(r'[^\w\-_]')
+
+# Znakovi nedozvoljeni u nazivu fajla (zamenjuju se sa '_') i ne-alfanumerički znakovi
+UNSAFE_FILENAME_RE = re.compile(r'[\\/*?:"<>|]')
+NON_WORD_RE = re.compile(r'[^\w]')
+
+
+class _FilenameStripTable(dict):
+    r"""Tabela za str.translate - zadržava isto što i [\w\-_], ostale znakove briše"""
+
+    def __missing__(self, code):
+        # Odluka za znak se računa jednom i pamti u tabeli
+        char = chr(code)
+        value = char if (char.isalnum() or char in '-_') else None
+        self[code] = value
+        return value
+
+
+FILENAME_STRIP_TABLE = _FilenameStripTable()
+
+# Ekstenzije video fajlova za automatsko mapiranje titla
+VIDEO_EXTENSIONS = ('.mkv', '.mp4', '.avi', '.ts', '.mov', '.m2ts')
+
+# Ekstenzije titlova koje prikazuje pretraživač fajlova
+SUBTITLE_EXTENSIONS = ('.srt', '.sub', '.ass', '.ssa', '.vtt', '.txt')
+
+# Red u pretraživaču fajlova (tuple umesto dict-a po fajlu)
+SubtitleFile = namedtuple('SubtitleFile', ('path', 'name', 'size', 'date'))
+
+# Prioriteti sortiranja rezultata (manji broj = više na listi)
+SITE_PRIORITY = {'subdl': 0, 'opensubtitles': 1}
+
+# SMART pretraga:
+# 1. SubDL IMDB, 2. SubDL File Name, 3. SubDL Film Name, 4. SubDL ostalo, 5. OpenSubtitles, 6. Ostalo
+SUBDL_METHOD_RANK = {'imdb': 0, 'file_name': 1, 'film_name': 2}
+SMART_SITE_PRIORITY = {'opensubtitles': 4}
+
+# Potpis lokalnog zaglavlja ZIP arhive (samo "PK" hvata i druge binarne fajlove)
+ZIP_MAGIC = b'PK\x03\x04'
+
+# Potpisi formata titla: (potpis, ekstenzija, traži bilo gde u zaglavlju)
+SUBTITLE_SIGNATURES = (
+    (b'WEBVTT', '.vtt', False),
+    (b'1\r\n0', '.sub', False),
+    (b'[Script Info]', '.ass', True)
+)
+
+# Jedinice za skraćeni prikaz broja preuzimanja (prag, sufiks)
+DOWNLOAD_UNITS = ((1000000, 'M'), (1000, 'K'))
+
+# Oznake u listi rezultata: sajt -> (prefiks, info o servisu)
+SITE_INDICATORS = {
+    'SUBDL': ("[SubDL] ", " (Unlimited)"),
+    'OPENSUBTITLES': ("[OS] ", " (5/day)")
+}
+
+# Oznake kvaliteta SubDL rezultata u SMART pretrazi (metod pretrage -> ikona)
+SMART_QUALITY_INDICATORS = {
+    'IMDB': "⭐ ",       # Najbolje
+    'FILE_NAME': "✓ ",  # Dobro
+    'FILM_NAME': "~ "   # OK
+}
+
+# Svi prefiksi kvaliteta su dva znaka (ikona + razmak)
+QUALITY_PREFIXES = frozenset(SMART_QUALITY_INDICATORS.values())
+
+# Redosled i oznake statistike u statusu SMART pretrage
+SMART_STATS_LABELS = (
+    ('imdb', "⭐IMDB"),
+    ('file_name', "✓File"),
+    ('film_name', "~Film"),
+    ('opensubtitles', "OS")
+)
+
+# Ikone metoda pretrage u ADVANCED pretrazi
+METHOD_ICONS = {
+    'IMDB': "⭐ ",
+    'IMDB_DIRECT': "⭐ ",
+    'FILE_NAME': "📁 ",
+    'FILM_NAME': "🎬 "
+}
+
+# Prikazni nazivi metoda pretrage (ključevi malim i velikim slovima)
+METHOD_NAMES = {
+    key: name
+    for method, name in (
+        ('imdb', "Imdb"),
+        ('imdb_direct', "Imdb Direct"),
+        ('file_name', "File Name"),
+        ('film_name', "Film Name"),
+        ('standard', "Standard"),
+        ('opensubtitles', "Opensubtitles")
+    )
+    for key in (method, method.upper())
+}
+
+# Izbori za konfiguracioni ekran (ConfigSelection traži listu, ne tuple)
+SERVICE_CHOICES = [
+    ("both", "Both services (Recommended)"),
+    ("subdl", "SubDL only (Unlimited)"),
+    ("opensubtitles", "OpenSubtitles only")
+]
+MAX_RESULTS_CHOICES = [("20", "20"), ("30", "30"), ("50", "50"), ("100", "100")]
+
+# Tekstovi Help i About prozora glavnog menija (statični, prave se jednom)
+HELP_TEXT = f"""Ciefp Subtitles v{PLUGIN_VERSION}
+1.STANDARD SEARCH:
+   • Uses Film Name only
+   • MENU: search again without cached results
+
+2.SMART SEARCH (NEW):
+   • Tries ALL methods in order:
+     1. IMDB ID (best) - tt1375666
+     2. File Name (good) - Movie.Name.2023
+     3. Film Name (ok)
+   • MENU: search again without cached results
+
+3.ADVANCED SEARCH:
+   • Manual choice: IMDB/File/Film
+   • Use the up and down arrows to change
+
+4. TITLOVI.COM SEARCH: (NEW - COMPLETELY SEPARATE!)
+   • Balkan languages ONLY (srp/hrv/bos/slv/mkd)
+   • NO API key required
+   • HTML scraping (no API)
+   • Perfect for Balkan users
+
+..:: CiefpSettings ::.."""
+
+ABOUT_TEXT = """Ciefp Subtitles Plugin
+1. Standard Search (Film Name)
+   Simple and fast
+
+2. Smart Search (RECOMMENDED!)
+   Auto-tries: IMDB > File > Film
+   Shows which method worked
+
+3. Advanced Search (Film Name,File Name,IMDB ID)
+   Manual choice with arrows ↑ ↓
+
+4. Titlovi.com (NEW!)
+   Balkan languages ONLY
+   NO API key needed
+   Separate from other services
+
+SERVICES:
+• SubDL: Unlimited (API key)
+• OpenSubtitles: 5/day free
+• Titlovi.com: Free, Balkan only
+..:: CiefpSettings ::.."""
+
+# Informacije o pluginu (OpenSubtitlesPlugin.credits)
+CREDITS = (
+    ("Ciefp Subtitles", f"v{PLUGIN_VERSION}"),
+    ("Search Methods", "Standard, Smart, Advanced"),
+    ("Smart Search", "IMDB → File → Film (auto)"),
+    ("Best Results", "Use IMDB ID (tt1375666)")
+)
+
+# Brži JSON parser ako je dostupan na image-u
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Deljena HTTP sesija (keep-alive) za pomoćne pozive kao što je test API ključeva
+HTTP_TIMEOUT = (3.05, 10)  # (connect, read)
+HTTP_SESSION = requests.Session()
+_http_adapter = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+)
+HTTP_SESSION.mount("https://", _http_adapter)
+HTTP_SESSION.mount("http://", _http_adapter)
+
+# Preuzimanje titla se čita u delovima; veći odgovor od ovoga sigurno nije titl
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+MAX_DOWNLOAD_SIZE = 8 * 1024 * 1024
+
+# Tekstualni titl se pri upisu kodira u delovima ove veličine (znakova)
+WRITE_CHUNK_SIZE = 64 * 1024
+
+# Deljeni pool za paralelne pretrage koje se čekaju odmah (niti se kreiraju po potrebi)
+SEARCH_POOL = ThreadPoolExecutor(max_workers=4)
+
+# Broj prvih SubDL rezultata koji se preuzimaju unapred dok korisnik bira
+PREFETCH_COUNT = 2
 
 # Simple translation function if _ is not defined
 try:
@@ -53,29 +287,47 @@ except NameError:
 class SubDLAPI:
     """Klasa za komunikaciju sa zvaničnim SubDL API-jem - POBOLJŠANO"""
     
-    def __init__(self):
+    def __init__(self, session=None):
         self.base_url = "https://api.subdl.com/api/v1/subtitles"
         self.download_base = "https://dl.subdl.com"
-        self.session = requests.Session()
         self.api_key = ""
         
-        # Retry mehanizam
-        retry_strategy = Retry(
-            total=3,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504]
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("https://", adapter)
-        self.session.mount("http://", adapter)
+        if session is not None:
+            # Koristi postojeću (deljenu) sesiju
+            self.session = session
+        else:
+            self.session = requests.Session()
+            
+            # Retry mehanizam
+            retry_strategy = Retry(
+                total=3,
+                backoff_factor=1,
+                status_forcelist=[429, 500, 502, 503, 504]
+            )
+            adapter = HTTPAdapter(max_retries=retry_strategy)
+            self.session.mount("https://", adapter)
+            self.session.mount("http://", adapter)
         
         self.headers = {
             'User-Agent': 'Enigma2 SubDL Plugin/1.4',
             'Accept': 'application/json'
         }
-    
+
+        # Keš odgovora pretrage: key -> (timestamp, rezultati)
+        self._search_cache = {}
+
+        # Timeout pretrage i poslednja greška (za test API ključa)
+        self.timeout = 15
+        self.last_error = None
+
+    def set_timeout(self, timeout):
+        """Postavljanje timeout-a pretrage - broj ili (connect, read)"""
+        self.timeout = timeout
+
     def set_api_key(self, api_key):
         """Postavljanje API ključa"""
+        if api_key != self.api_key:
+            self._search_cache.clear()
         self.api_key = api_key
     
     def smart_search(self, query, languages=None, season=None, episode=None):
@@ -151,7 +403,7 @@ class SubDLAPI:
                 unique_results.append(result)
             elif not file_id:
                 # Ako nema file_id, koristi kombinaciju title+language
-                key = f"{result.get('title', '')}_{result.get('language', '')}"
+                key = (result.get('title', ''), result.get('language', ''))
                 if key not in seen_ids:
                     seen_ids.add(key)
                     unique_results.append(result)
@@ -278,9 +530,17 @@ class SubDLAPI:
         params["hi"] = "1"
         
         print(f"[SubDL] API params: {params}")
-        
+
+        # Isti upit u poslednjih SUBDL_CACHE_TTL sekundi - vrati keširane rezultate
+        cache_key = tuple(sorted((k, str(v)) for k, v in params.items()))
+        cached = self._search_cache.get(cache_key)
+        if cached and time.time() - cached[0] < SUBDL_CACHE_TTL:
+            print(f"[SubDL] Returning {len(cached[1])} cached results")
+            return [dict(r) for r in cached[1]]
+
         try:
-            response = self.session.get(self.base_url, params=params, headers=self.headers, timeout=15)
+            self.last_error = None
+            response = self.session.get(self.base_url, params=params, headers=self.headers, timeout=self.timeout)
             print(f"[SubDL] Response status: {response.status_code}")
             
             if response.status_code != 200:
@@ -301,11 +561,22 @@ class SubDLAPI:
             subtitles_list = data.get("subtitles", [])
             
             print(f"[SubDL] Found {len(results_list)} results, {len(subtitles_list)} subtitles")
+
+            parsed = self.parse_api_response(results_list, subtitles_list, query, season, episode)
+
+            if len(self._search_cache) >= SUBDL_CACHE_SIZE:
+                self._search_cache.pop(next(iter(self._search_cache)))
+            self._search_cache[cache_key] = (time.time(), [dict(r) for r in parsed])
+
+            return parsed
             
-            return self.parse_api_response(results_list, subtitles_list, query, season, episode)
-            
+        except requests.exceptions.Timeout as e:
+            print(f"[SubDL] API search timeout: {e}")
+            self.last_error = e
+            return []
         except Exception as e:
             print(f"[SubDL] API search error: {e}")
+            self.last_error = e
             import traceback
             traceback.print_exc()
             return []
@@ -432,25 +703,31 @@ class SubDLAPI:
                 'Referer': 'https://subdl.com/'
             }
             
-            response = requests.get(download_url, headers=headers, timeout=30)
+            response = self.session.get(download_url, headers=headers, timeout=30, stream=True)
             
             if response.status_code != 200:
-                print(f"[SubDL] Download failed: {response.status_code}")
-                print(f"[SubDL] Response: {response.text[:200]}")
+                # stream=True - odgovor se mora zatvoriti da bi se konekcija vratila u pool
+                with response:
+                    print(f"[SubDL] Download failed: {response.status_code}")
+                    print(f"[SubDL] Response: {response.text[:200]}")
                 
                 # Probaj alternativni format ako prvi ne radi
                 alt_url = f"{self.download_base}/{file_id}/download"
                 print(f"[SubDL] Trying alternative URL: {alt_url}")
-                response = requests.get(alt_url, headers=headers, timeout=30)
+                response = self.session.get(alt_url, headers=headers, timeout=30, stream=True)
                 
                 if response.status_code != 200:
+                    response.close()
                     print(f"[SubDL] Alternative also failed: {response.status_code}")
                     return None
             
-            content = response.content
+            with response:
+                content = read_download(response)
+            if content is None:
+                return None
             
             # Procesiraj ZIP
-            if content.startswith(b'PK'):
+            if content.startswith(ZIP_MAGIC):
                 from io import BytesIO
                 from zipfile import ZipFile, BadZipFile
                 try:
@@ -516,7 +793,8 @@ class TitloviAPI:
             backoff_factor=1,
             status_forcelist=[429, 500, 502, 503, 504]
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # Napredna i fallback pretraga sada idu paralelno na isti host
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=4, max_retries=retry_strategy)
         self.session.mount("https://", adapter)
         self.session.mount("http://", adapter)
 
@@ -764,7 +1042,8 @@ class TitloviAPI:
                 try:
                     prevod_info = unique_prevods[prevod_id]
 
-                    print(f"[TitloviAPI] Processing prevod {i + 1}/{min(len(prevod_ids), 10)}: {prevod_id}")
+                    if DEBUG:
+                        print(f"[TitloviAPI] Processing prevod {i + 1}/{min(len(prevod_ids), 10)}: {prevod_id}")
 
                     # KORAK 3: Poseti specifičnu prevod stranicu za detalje
                     prevod_details = self.fetch_prevod_details(
@@ -776,13 +1055,15 @@ class TitloviAPI:
 
                     if prevod_details:
                         results.append(prevod_details)
-                        print(f"[TitloviAPI] ✓ Added prevod {prevod_id}")
+                        if DEBUG:
+                            print(f"[TitloviAPI] ✓ Added prevod {prevod_id}")
                     else:
                         # Kreiraj jednostavan rezultat ako ne možemo dobiti detalje
                         simple_result = self.create_simple_result(prevod_id, query, prevod_info['url'])
                         if simple_result:
                             results.append(simple_result)
-                            print(f"[TitloviAPI] Added simple result for {prevod_id}")
+                            if DEBUG:
+                                print(f"[TitloviAPI] Added simple result for {prevod_id}")
 
                 except Exception as e:
                     print(f"[TitloviAPI] Error processing prevod {prevod_id}: {str(e)[:50]}")
@@ -1197,7 +1478,7 @@ class TitloviAPI:
         print(f"[TitloviAPI] Processing download content from {source_name}, size: {len(content)} bytes")
 
         # Proveri da li je ZIP
-        if content[:2] == b'PK':
+        if content.startswith(ZIP_MAGIC):
             print(f"[TitloviAPI] ZIP file detected - extracting ALL SRT files")
             result = self.extract_from_zip(content)
 
@@ -1240,7 +1521,8 @@ class TitloviAPI:
             srt_files = []
             for filename in file_list:
                 if filename.lower().endswith('.srt'):
-                    print(f"[TitloviAPI] Found SRT: {filename}")
+                    if DEBUG:
+                        print(f"[TitloviAPI] Found SRT: {filename}")
                     content = zipfile.read(filename)
                     srt_files.append({
                         'name': filename,
@@ -1257,8 +1539,9 @@ class TitloviAPI:
                 largest_srt = max(srt_files, key=lambda x: x['size'])
 
                 # Log koji su svi SRT fajlovi
-                for srt in srt_files:
-                    print(f"[TitloviAPI] Available SRT: {srt['name']} ({srt['size']} bytes)")
+                if DEBUG:
+                    for srt in srt_files:
+                        print(f"[TitloviAPI] Available SRT: {srt['name']} ({srt['size']} bytes)")
 
                 print(f"[TitloviAPI] Returning {len(srt_files)} SRT files")
 
@@ -1396,7 +1679,7 @@ class TitloviAPI:
             print(f"\n✓ Download successful: {len(content)} bytes")
 
             # Proveri tip
-            if content[:2] == b'PK':
+            if content.startswith(ZIP_MAGIC):
                 print(f"  Type: ZIP archive")
             elif self.is_subtitle_content(content):
                 print(f"  Type: Direct subtitle")
@@ -1419,7 +1702,11 @@ class OpenSubtitlesConfig:
         self.opensubtitles_apikey_file = os.path.join(CONFIG_DIR, "opensubtitles_apikey.txt")
         self.subdl_apikey_file = os.path.join(CONFIG_DIR, "subdl_apikey.txt")
         self.settings_file = os.path.join(CONFIG_DIR, "settings.json")
-        
+
+        # Keš postavki - ponovo se čita samo kad se promeni mtime fajla
+        self._settings_cache = None
+        self._settings_mtime = None
+
     def read_opensubtitles_api_key(self):
         """Čitanje OpenSubtitles API ključa iz fajla"""
         if fileExists(self.opensubtitles_apikey_file):
@@ -1470,6 +1757,16 @@ class OpenSubtitlesConfig:
     
     def read_settings(self):
         """Čitanje postavki iz JSON fajla"""
+        try:
+            mtime = os.stat(self.settings_file).st_mtime
+        except OSError:
+            mtime = None
+
+        if self._settings_cache is not None and mtime == self._settings_mtime:
+            # Kopija - pozivalac (npr. konfiguracioni ekran) sme da je menja bez kvarenja keša
+            return dict(self._settings_cache)
+
+        # Podrazumevane vrednosti se prave samo kad se fajl stvarno čita
         defaults = {
             'languages': ['sr', 'hr'],
             'save_path': '/media/hdd/subtitles/',
@@ -1484,10 +1781,13 @@ class OpenSubtitlesConfig:
             'max_results': 50,
             'subdl_include_comments': False,
             'subdl_include_releases': True,
-            'subdl_full_season': False
+            'subdl_full_season': False,
+            'subdl_prefetch': False,
+            'results_cache_ttl': RESULTS_CACHE_TTL
         }
-        
-        if fileExists(self.settings_file):
+
+        settings = defaults
+        if mtime is not None:
             try:
                 with open(self.settings_file, 'r') as f:
                     loaded = json.load(f)
@@ -1495,20 +1795,181 @@ class OpenSubtitlesConfig:
                     for key, value in defaults.items():
                         if key not in loaded:
                             loaded[key] = value
-                    return loaded
+                    settings = loaded
             except:
                 pass
-        return defaults
-    
+
+        self._settings_cache = settings
+        self._settings_mtime = mtime
+        return dict(settings)
+
     def write_settings(self, settings):
         """Pisanje postavki u JSON fajl"""
         try:
+            # Ceo JSON se sastavi u memoriji i upiše jednim write pozivom
+            data = json.dumps(settings, indent=2)
             with open(self.settings_file, 'w') as f:
-                json.dump(settings, f, indent=2)
+                f.write(data)
+            self._settings_cache = None
             return True
         except:
             return False
 
+def requires_api_key(key_attr, empty=None):
+    """Dekorator: ako API ključ (self.<key_attr>) nije podešen, vrati praznu vrednost bez poziva"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            if not getattr(self, key_attr):
+                print(f"[API] {func.__name__}: No API key!")
+                return empty() if empty else None
+            return func(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+def unique_results(results):
+    """Izbaci rezultate koji pokazuju na isti fajl (isti sajt + file_id ili naslov/jezik/release)"""
+    seen = set()
+    unique = []
+    for result in results:
+        get = result.get
+        key = (get('site'), get('file_id') or (get('title'), get('language'), get('release_info')))
+        if key not in seen:
+            seen.add(key)
+            unique.append(result)
+    return unique
+
+def subtitle_extension(content):
+    """Ekstenzija titla prema potpisu u prvih 100 bajtova sadržaja"""
+    if isinstance(content, bytes):
+        # find() sa granicom pretražuje zaglavlje bez pravljenja kopije (slice)
+        for signature, ext, anywhere in SUBTITLE_SIGNATURES:
+            if content.find(signature, 0, 100) != -1 if anywhere else content.startswith(signature):
+                return ext
+    return '.srt'
+
+def rename_if_free(src, dst):
+    """Preimenuj fajl samo ako dst ne postoji - ime se rezerviše atomski (O_EXCL)"""
+    try:
+        fd = os.open(dst, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+    except FileExistsError:
+        return False
+    os.close(fd)
+    try:
+        os.replace(src, dst)
+    except OSError:
+        os.remove(dst)  # Ukloni rezervisano prazno ime
+        raise
+    return True
+
+def read_download(response, limit=MAX_DOWNLOAD_SIZE):
+    """Pročitaj stream=True odgovor u delovima, odustani ako pređe limit"""
+    declared = response.headers.get('Content-Length')
+    if declared and declared.isdigit() and int(declared) > limit:
+        print(f"[DOWNLOAD] Response too large: {declared} bytes")
+        return None
+    content = bytearray()
+    for chunk in response.iter_content(DOWNLOAD_CHUNK_SIZE):
+        content += chunk
+        if len(content) > limit:
+            print(f"[DOWNLOAD] Response exceeded {limit} bytes, aborting")
+            return None
+    return bytes(content)
+
+def write_subtitle(full_path, content, make_dir=True):
+    """Upiši titl na disk (bezbedno i iz pozadinske niti)"""
+    if make_dir:
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+    with open(full_path, 'wb') as f:
+        if isinstance(content, str):
+            # Tekst se kodira deo po deo - u memoriji je samo jedan kodiran deo, ne ceo titl;
+            # binarni upis ostavlja krajeve redova (\r\n) netaknute
+            for start in range(0, len(content), WRITE_CHUNK_SIZE):
+                f.write(content[start:start + WRITE_CHUNK_SIZE].encode('utf-8'))
+        else:
+            f.write(content)
+
+def format_downloads(downloads):
+    """Skraćeni prikaz broja preuzimanja (1.2K, 3.4M)"""
+    for threshold, suffix in DOWNLOAD_UNITS:
+        if downloads >= threshold:
+            return f"{downloads / threshold:.1f}{suffix}"
+    return str(downloads)
+
+def defer_while_open(screen, func, *args, **kwargs):
+    """deferToThread za ekran: rezultat se ne isporučuje ako je ekran u međuvremenu
+    zatvoren, pa callback-ovi ne diraju uništene widget-e"""
+    if getattr(screen, 'closed', None) is None:
+        screen.closed = False
+        screen.onClose.append(lambda: setattr(screen, 'closed', True))
+
+    result = Deferred()
+
+    def deliver(value):
+        if screen.closed:
+            print(f"[BACKGROUND] Screen closed, dropping result of {func.__name__}")
+        elif isinstance(value, Failure):
+            result.errback(value)
+        else:
+            result.callback(value)
+
+    deferToThread(func, *args, **kwargs).addBoth(deliver)
+    return result
+
+def set_text(label, text):
+    """Postavi tekst labele samo ako se promenio (setText uvek iscrtava ponovo)"""
+    if label.getText() != text:
+        label.setText(text)
+
+def add_color_keys(screen, red="", green="", yellow="", blue=""):
+    """Natpisi četiri dugmeta u boji (key_red ... key_blue) kao StaticText izvori ekrana"""
+    for key, text in zip(("key_red", "key_green", "key_yellow", "key_blue"), (red, green, yellow, blue)):
+        screen[key] = StaticText(text)
+
+def parse_number(text):
+    """Broj iz polja za unos (sezona, epizoda) ili None ako nije ceo broj"""
+    text = text.strip()
+    if text[:1] in '+-':
+        sign, digits = text[:1], text[1:]
+    else:
+        sign, digits = '', text
+    return int(sign + digits) if digits.isdecimal() else None
+
+def format_thousands(downloads):
+    """Broj preuzimanja sa tačkom kao separatorom hiljada (12.345)"""
+    if isinstance(downloads, int):
+        return f"{downloads:,}".replace(",", ".")
+    return str(downloads)
+
+@functools.lru_cache(maxsize=512)
+def series_label(season, episode=None):
+    """Oznaka ' [S01E02]' ili ' [S01]' za red rezultata - isti par se formatira samo jednom"""
+    return f" [S{season:02d}E{episode:02d}]" if episode else f" [S{season:02d}]"
+
+def opensubtitles_result(attr, season=None, episode=None):
+    """Kreiraj rezultat iz 'attributes' dela OpenSubtitles.com odgovora"""
+    # Proveri da li je serija
+    feature_details = attr.get('feature_details', {})
+    get = attr.get
+    fd_get = feature_details.get
+
+    return {
+        'title': get('release_name') or fd_get('movie_name', 'Unknown'),
+        'language': get('language', 'Unknown'),
+        'downloads': get('download_count', 0),
+        'file_id': attr['files'][0]['file_id'],
+        'rating': get('ratings', 0.0),
+        'fps': get('fps', 0),
+        'hd': get('hd', False),
+        'hearing_impaired': get('hearing_impaired', False),
+        'is_series': bool(fd_get('parent_title', '')) or season is not None,
+        'season': season or fd_get('season_number'),
+        'episode': episode or fd_get('episode_number'),
+        'release_info': get('release', ''),
+        'year': fd_get('year'),
+        'site': 'opensubtitles'
+    }
+
 class SubtitlesAPI:
     """Glavna API klasa koja upravlja svim servisima - DODATA TITLOVI.COM"""
 
@@ -1522,7 +1983,8 @@ class SubtitlesAPI:
             backoff_factor=1,
             status_forcelist=[429, 500, 502, 503, 504]
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # Jedna sesija (keep-alive, TLS) za OpenSubtitles i SubDL, i za paralelne pretrage
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry_strategy)
         self.session.mount("https://", adapter)
         self.session.mount("http://", adapter)
 
@@ -1531,7 +1993,7 @@ class SubtitlesAPI:
         self.subdl_api_key = self.config.read_subdl_api_key()
 
         # Inicijalizuj servise
-        self.subdl_api = SubDLAPI()
+        self.subdl_api = SubDLAPI(self.session)
         self.subdl_api.set_api_key(self.subdl_api_key)
 
         # NEMA potrebe za API ključem za Titlovi.com - JAVAN SERVIS
@@ -1540,11 +2002,103 @@ class SubtitlesAPI:
         # OpenSubtitles.com endpoints
         self.opensubtitles_base = "https://api.opensubtitles.com/api/v1"
 
+        # Keš rezultata pretrage: key -> (timestamp, rezultati)
+        self._results_cache = {}
+        self._results_cache_lock = threading.Lock()
+        self._results_save_timer = None
+        self._load_results_cache()
+
     def update_api_keys(self):
         """Ažuriraj API ključeve nakon promene u konfiguraciji"""
         self.opensubtitles_api_key = self.config.read_opensubtitles_api_key()
         self.subdl_api_key = self.config.read_subdl_api_key()
         self.subdl_api.set_api_key(self.subdl_api_key)
+        self.clear_results_cache()
+
+    def clear_results_cache(self):
+        """Obriši keširane rezultate pretrage (ručno osvežavanje, novi API ključ)"""
+        with self._results_cache_lock:
+            self._results_cache.clear()
+            try:
+                os.remove(RESULTS_CACHE_FILE)
+            except OSError:
+                pass
+
+    def _load_results_cache(self):
+        """Učitaj neistekle rezultate sačuvane pre restarta"""
+        try:
+            with open(RESULTS_CACHE_FILE, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return
+        ttl = self.config.read_settings().get('results_cache_ttl', RESULTS_CACHE_TTL)
+        now = time.time()
+        loaded = {}
+        try:
+            for key, stamp, results in entries[-RESULTS_CACHE_SIZE:]:
+                if now - stamp < ttl:
+                    # JSON vraća liste - ključ (i lista jezika u njemu) mora biti tuple
+                    key = tuple(tuple(part) if isinstance(part, list) else part for part in key)
+                    loaded[key] = (stamp, results)
+        except (TypeError, ValueError) as e:
+            # Fajl u /tmp nije u očekivanom obliku (stara verzija, tuđi fajl) - ne sme da obori plugin
+            print(f"[API] Ignoring invalid results cache file: {e}")
+            try:
+                os.remove(RESULTS_CACHE_FILE)
+            except OSError:
+                pass
+            return
+        self._results_cache.update(loaded)
+        print(f"[API] Loaded {len(self._results_cache)} cached searches")
+
+    def _schedule_results_save(self):
+        """Zakaži snimanje keša - upisi u kratkom roku (npr. pretrage po jezicima) se spajaju"""
+        with self._results_cache_lock:
+            if self._results_save_timer is None:
+                self._results_save_timer = threading.Timer(RESULTS_CACHE_SAVE_DELAY, self._save_results_cache)
+                self._results_save_timer.daemon = True
+                self._results_save_timer.start()
+
+    def _save_results_cache(self):
+        """Upiši keš u /tmp (privremeni fajl pa zamena, poziva ga tajmer iz posebne niti)"""
+        with self._results_cache_lock:
+            self._results_save_timer = None
+            entries = [[key, stamp, results] for key, (stamp, results) in list(self._results_cache.items())]
+            tmp_path = RESULTS_CACHE_FILE + ".tmp"
+            try:
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(entries, f, ensure_ascii=False)
+                os.replace(tmp_path, RESULTS_CACHE_FILE)
+            except (OSError, TypeError, ValueError) as e:
+                print(f"[API] Results cache not saved: {e}")
+
+    def _results_cache_key(self, kind, query, languages, season, episode, settings):
+        """Ključ keša: vrsta pretrage, upit, jezici, epizoda, izabrani servis i koji servisi
+        su aktivni (uključeni i sa API ključem) - novi ključ ne vraća stari, manji skup rezultata"""
+        return (kind, (query or '').lower().strip(), tuple(sorted(languages)),
+                season, episode, settings.get('preferred_service', 'both'),
+                bool(self.subdl_api_key) and settings.get('use_subdl', True),
+                bool(self.opensubtitles_api_key) and settings.get('use_opensubtitles', True))
+
+    def _get_cached_results(self, cache_key, settings):
+        """Vrati kopiju keširanih rezultata ili None ako su istekli"""
+        cached = self._results_cache.get(cache_key)
+        if cached and time.time() - cached[0] < settings.get('results_cache_ttl', RESULTS_CACHE_TTL):
+            print(f"[API] Returning {len(cached[1])} cached results")
+            return [dict(r) for r in cached[1]]
+        return None
+
+    def _store_results(self, cache_key, results):
+        """Sačuvaj rezultate u keš, izbaci najstariji unos kad je pun"""
+        if not results:
+            return
+        # Pod lock-om - više pretraga (downloadAllLanguages) upisuje istovremeno
+        with self._results_cache_lock:
+            self._results_cache.pop(cache_key, None)
+            if len(self._results_cache) >= RESULTS_CACHE_SIZE:
+                self._results_cache.pop(next(iter(self._results_cache)), None)
+            self._results_cache[cache_key] = (time.time(), [dict(r) for r in results])
+        self._schedule_results_save()
     
     def search_all_smart(self, query, languages=None, season=None, episode=None):
         """
@@ -1557,6 +2111,11 @@ class SubtitlesAPI:
         if languages is None:
             languages = settings.get('languages', ['sr', 'hr'])
         
+        cache_key = self._results_cache_key('smart', query, languages, season, episode, settings)
+        cached = self._get_cached_results(cache_key, settings)
+        if cached is not None:
+            return cached
+        
         use_opensubtitles = settings.get('use_opensubtitles', True) and self.opensubtitles_api_key
         use_subdl = settings.get('use_subdl', True) and self.subdl_api_key
         preferred_service = settings.get('preferred_service', 'both')
@@ -1607,10 +2166,7 @@ class SubtitlesAPI:
             site = result.get('site', '').lower()
             
             # Ako ima file_id, koristi ga za jedinstvenost
-            if file_id:
-                key = f"{site}_{file_id}"
-            else:
-                key = f"{site}_{title}_{lang}"
+            key = (site, file_id) if file_id else (site, title, lang)
             
             if key not in seen:
                 seen.add(key)
@@ -1620,27 +2176,9 @@ class SubtitlesAPI:
         def sort_key(x):
             site = x.get('site', '').lower()
             method = x.get('search_method', '').lower()
-            
-            # Prioriteti:
-            # 1. SubDL IMDB
-            # 2. SubDL File Name  
-            # 3. SubDL Film Name
-            # 4. OpenSubtitles
-            # 5. Ostalo
-            
             if site == 'subdl':
-                if method == 'imdb':
-                    return 0
-                elif method == 'file_name':
-                    return 1
-                elif method == 'film_name':
-                    return 2
-                else:
-                    return 3
-            elif site == 'opensubtitles':
-                return 4
-            else:
-                return 5
+                return SUBDL_METHOD_RANK.get(method, 3)
+            return SMART_SITE_PRIORITY.get(site, 5)
         
         unique_results.sort(key=sort_key)
         
@@ -1649,12 +2187,39 @@ class SubtitlesAPI:
         final_results = unique_results[:max_results]
         
         print(f"[API SMART] Total unique results: {len(final_results)}")
+        # Prazan rezultat može biti i greška mreže - ne kešira se
+        if final_results:
+            self._store_results(cache_key, final_results)
         return final_results
 
     def search_titlovi_only(self, query, languages=None, season=None, episode=None):
         """SAMO Titlovi.com pretraga"""
         print(f"[TITLOVI ONLY] Searching: '{query}'")
-        return self.titlovi_api.search(query, languages, season, episode)
+        settings = self.config.read_settings()
+        cache_key = self._results_cache_key('titlovi', query, languages or [], season, episode, settings)
+        cached = self._get_cached_results(cache_key, settings)
+        if cached is not None:
+            return cached
+
+        results = self.titlovi_api.search(query, languages, season, episode)
+        if results:
+            self._store_results(cache_key, results)
+        return results
+
+    def search_titlovi_advanced(self, query, params):
+        """Napredna Titlovi.com pretraga, keširana po upitu i svim parametrima"""
+        settings = self.config.read_settings()
+        # Parametri (sezona, epizoda, tip, jezik, sortiranje) idu u ključ umesto liste jezika
+        param_list = [f"{key}={value}" for key, value in params.items()]
+        cache_key = self._results_cache_key('titlovi_advanced', query, param_list, None, None, settings)
+        cached = self._get_cached_results(cache_key, settings)
+        if cached is not None:
+            return cached
+
+        results = self.titlovi_api.advanced_search(query=query, params=params)
+        if results:
+            self._store_results(cache_key, results)
+        return results
 
     def download_titlovi(self, result):
         """Download sa Titlovi.com"""
@@ -1668,16 +2233,19 @@ class SubtitlesAPI:
         if languages is None:
             languages = settings.get('languages', ['sr', 'hr'])
         
+        cache_key = self._results_cache_key('all', query, languages, season, episode, settings)
+        cached = self._get_cached_results(cache_key, settings)
+        if cached is not None:
+            return cached
+        
         use_opensubtitles = settings.get('use_opensubtitles', True) and self.opensubtitles_api_key
         use_subdl = settings.get('use_subdl', True) and self.subdl_api_key
         preferred_service = settings.get('preferred_service', 'both')
         
-        all_results = []
+        searches = []  # (sajt, funkcija) - SubDL prvi (ima unlimited download)
         
-        # Prvo probaj SubDL ako je podešen kao preferirani ili oba
         if use_subdl and preferred_service in ['both', 'subdl']:
-            print(f"[API] Searching SubDL...")
-            subdl_results = self.subdl_api.search(
+            searches.append(('subdl', lambda: self.subdl_api.search(
                 query, 
                 languages, 
                 season, 
@@ -1685,20 +2253,30 @@ class SubtitlesAPI:
                 include_comments=settings.get('subdl_include_comments', False),
                 include_releases=settings.get('subdl_include_releases', True),
                 full_season=settings.get('subdl_full_season', False)
-            )
-            for result in subdl_results:
-                result['site'] = 'subdl'
-            all_results.extend(subdl_results)
-            print(f"[API] SubDL found: {len(subdl_results)} results")
+            )))
         
-        # Onda probaj OpenSubtitles
         if use_opensubtitles and preferred_service in ['both', 'opensubtitles']:
-            print(f"[API] Searching OpenSubtitles.com...")
-            opensub_results = self.search_opensubtitles(query, languages, season, episode)
-            for result in opensub_results:
-                result['site'] = 'opensubtitles'
-            all_results.extend(opensub_results)
-            print(f"[API] OpenSubtitles found: {len(opensub_results)} results")
+            searches.append(('opensubtitles',
+                             lambda: self.search_opensubtitles(query, languages, season, episode)))
+        
+        # Servisi se pretražuju paralelno - ukupno vreme je najsporiji servis, ne zbir
+        print(f"[API] Searching {', '.join(site for site, _ in searches)}...")
+        # Deljeni SEARCH_POOL - search_all se nikad ne izvršava u samom pool-u, pa čekanje ne blokira
+        if len(searches) > 1:
+            futures = [(site, SEARCH_POOL.submit(search)) for site, search in searches]
+            site_results = [(site, future.result()) for site, future in futures]
+        else:
+            site_results = [(site, search()) for site, search in searches]
+        
+        all_results = []
+        sources = []  # Servisi koji su vratili rezultate
+        for site, results in site_results:
+            for result in results:
+                result['site'] = site
+            all_results.extend(results)
+            if results:
+                sources.append(site)
+            print(f"[API] {site} found: {len(results)} results")
         
         # Ukloni duplikate
         unique_results = []
@@ -1711,7 +2289,7 @@ class SubtitlesAPI:
             release = result.get('release_info', '').lower()[:20]
             site = result.get('site', '').lower()
             
-            key = f"{title}_{lang}_{release}_{site}"
+            key = (title, lang, release, site)
             
             if key not in seen:
                 seen.add(key)
@@ -1719,31 +2297,41 @@ class SubtitlesAPI:
         
         # Sortiraj - SubDL prvi (ima unlimited download), onda po downloads
         def sort_key(x):
-            site_priority = {'subdl': 0, 'opensubtitles': 1}.get(x.get('site', '').lower(), 2)
+            site_priority = SITE_PRIORITY.get(x.get('site', '').lower(), 2)
             downloads = x.get('downloads', 0)
             rating = x.get('rating', 0)
             return (site_priority, -downloads, -rating)
-        
-        unique_results.sort(key=sort_key)
+
+        if len(sources) > 1:
+            unique_results.sort(key=sort_key)
+        elif len(unique_results) > 1:
+            # Samo jedan servis - prioritet sajta je isti za sve, sortiraj samo po downloads/rating
+            unique_results.sort(key=lambda x: (-x.get('downloads', 0), -x.get('rating', 0)))
         
         # Ograniči broj rezultata
         max_results = settings.get('max_results', 50)
         final_results = unique_results[:max_results]
         
         print(f"[API] Total unique results: {len(final_results)}")
+        # Prazan rezultat može biti i greška mreže - ne kešira se
+        if final_results:
+            self._store_results(cache_key, final_results)
         return final_results
 
+    @requires_api_key('subdl_api_key', list)
     def search_subdl_by_imdb(self, imdb_id, languages=None, season=None, episode=None):
         """Pretraga SubDL po IMDB ID-u"""
-        if not self.subdl_api_key:
-            return []
-
         print(f"[API] Searching SubDL by IMDB ID: {imdb_id}")
 
         settings = self.config.read_settings()
         if languages is None:
             languages = settings.get('languages', ['sr', 'hr'])
 
+        cache_key = self._results_cache_key('imdb', imdb_id, languages, season, episode, settings)
+        cached = self._get_cached_results(cache_key, settings)
+        if cached is not None:
+            return cached
+
         # OVO JE KLJUČNO: Prosledi imdb_id parametar!
         results = self.subdl_api.search(
             query="",  # Prazan query jer koristimo imdb_id
@@ -1758,19 +2346,24 @@ class SubtitlesAPI:
         for result in results:
             result['site'] = 'subdl'
 
+        if results:
+            self._store_results(cache_key, results)
         return results
 
+    @requires_api_key('subdl_api_key', list)
     def search_subdl_by_filename(self, filename, languages=None):
         """Pretraga SubDL po nazivu fajla"""
-        if not self.subdl_api_key:
-            return []
-        
         print(f"[API] Searching SubDL by filename: {filename}")
         
         settings = self.config.read_settings()
         if languages is None:
             languages = settings.get('languages', ['sr', 'hr'])
         
+        cache_key = self._results_cache_key('file_name', filename, languages, None, None, settings)
+        cached = self._get_cached_results(cache_key, settings)
+        if cached is not None:
+            return cached
+        
         results = self.subdl_api.search(
             query="",  # Prazan query jer koristimo file_name
             languages=languages,
@@ -1782,31 +2375,22 @@ class SubtitlesAPI:
         for result in results:
             result['site'] = 'subdl'
         
+        if results:
+            self._store_results(cache_key, results)
         return results
     
+    @requires_api_key('opensubtitles_api_key', list)
     def search_opensubtitles(self, query, languages=None, season=None, episode=None):
         """Pretraga na OpenSubtitles.com"""
-        if not self.opensubtitles_api_key:
-            print("[OpenSubtitles] No API key!")
-            return []
-        
         if not languages:
             languages = ['sr', 'hr']
         
-        # Konvertuj jezike za OpenSubtitles
-        lang_map = {
-            'srp': 'sr', 'scc': 'sr', 'hrv': 'hr', 
-            'bos': 'bs', 'eng': 'en', 'slv': 'sl'
-        }
-        
-        converted_languages = []
-        for lang in languages:
-            lang_lower = lang.lower().strip()
-            converted = lang_map.get(lang_lower, lang_lower[:2])
-            if len(converted) == 2:
-                converted_languages.append(converted)
-        
-        converted_languages = list(set(converted_languages))
+        # Konvertuj jezike za OpenSubtitles (dict.fromkeys čuva redosled i uklanja duplikate)
+        converted = dict.fromkeys(
+            OPENSUBTITLES_LANG_MAP.get(lang_lower, lang_lower[:2])
+            for lang_lower in (lang.lower().strip() for lang in languages)
+        )
+        converted_languages = [code for code in converted if len(code) == 2]
         
         if not converted_languages:
             return []
@@ -1840,36 +2424,12 @@ class SubtitlesAPI:
                 print(f"[OpenSubtitles] Search failed: {response.status_code}")
                 return []
             
-            data = response.json()
-            results = []
-            
-            for item in data.get('data', []):
-                attr = item['attributes']
-                files = attr.get('files', [])
-                if not files:
-                    continue
-                
-                # Proveri da li je serija
-                feature_details = attr.get('feature_details', {})
-                parent_title = feature_details.get('parent_title', '')
-                
-                results.append({
-                    'title': attr.get('release_name') or feature_details.get('movie_name', 'Unknown'),
-                    'language': attr.get('language', 'Unknown'),
-                    'downloads': attr.get('download_count', 0),
-                    'file_id': files[0]['file_id'],
-                    'rating': attr.get('ratings', 0.0),
-                    'fps': attr.get('fps', 0),
-                    'hd': attr.get('hd', False),
-                    'hearing_impaired': attr.get('hearing_impaired', False),
-                    'is_series': bool(parent_title) or season is not None,
-                    'season': season or feature_details.get('season_number'),
-                    'episode': episode or feature_details.get('episode_number'),
-                    'release_info': attr.get('release', ''),
-                    'year': feature_details.get('year'),
-                    'site': 'opensubtitles'
-                })
-            
+            data = _json_loads(response.content)
+            results = [
+                opensubtitles_result(item['attributes'], season, episode)
+                for item in data.get('data', [])
+                if item['attributes'].get('files')
+            ]
             return results
             
         except Exception as e:
@@ -1904,11 +2464,9 @@ class SubtitlesAPI:
         print(f"[API] Download failed for {site}")
         return None
     
+    @requires_api_key('opensubtitles_api_key')
     def download_opensubtitles(self, file_id):
         """Preuzimanje sa OpenSubtitles.com"""
-        if not self.opensubtitles_api_key:
-            return None
-        
         headers = {
             'Api-Key': self.opensubtitles_api_key,
             'Content-Type': 'application/json',
@@ -1922,7 +2480,7 @@ class SubtitlesAPI:
         }
         
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{self.opensubtitles_base}/download",
                 headers=headers,
                 json=data,
@@ -1933,30 +2491,28 @@ class SubtitlesAPI:
                 print(f"[OpenSubtitles] Download failed: {response.status_code}")
                 return None
             
-            response_data = response.json()
+            response_data = _json_loads(response.content)
             
             if 'link' in response_data:
                 download_link = response_data['link']
-                sub_response = requests.get(download_link, timeout=30)
-                sub_response.raise_for_status()
-                
-                content = sub_response.content
-                
-                if content.startswith(b'PK'):
-                    from io import BytesIO
-                    from zipfile import ZipFile
+
+                # Telo se čita u delovima sa gornjom granicom veličine; ZIP se
+                # otvara preko BytesIO nad istim bytes objektom, bez nove kopije
+                with self.session.get(download_link, stream=True, timeout=30) as sub_response:
+                    sub_response.raise_for_status()
+                    content = read_download(sub_response)
+                if content is None:
+                    return None
+
+                if content.startswith(ZIP_MAGIC):
                     try:
-                        zipfile = ZipFile(BytesIO(content))
-                        srt_files = [f for f in zipfile.namelist() if f.lower().endswith('.srt')]
-                        if srt_files:
-                            return zipfile.read(srt_files[0])
-                        else:
-                            first_file = zipfile.namelist()[0]
-                            return zipfile.read(first_file)
+                        with ZipFile(BytesIO(content)) as zipfile:
+                            names = zipfile.namelist()
+                            name = next((n for n in names if n.lower().endswith('.srt')), names[0])
+                            return zipfile.read(name)
                     except:
-                        return content
-                else:
-                    return content
+                        pass
+                return content
             
             return None
             
@@ -1964,6 +2520,67 @@ class SubtitlesAPI:
             print(f"[OpenSubtitles] Download error: {e}")
             return None
 
+# Help tekstovi za konfiguracioni ekran
+HELP_API_KEYS = """API KEYS CONFIGURATION:
+
+1. OpenSubtitles.com API Key:
+   • Get from: https://www.opensubtitles.com
+   • Free account: 5 downloads/24h
+   • VIP account: 1000 downloads/day
+
+2. SubDL API Key:
+   • Get from: https://subdl.com
+   • Registered account needed
+   • Unlimited downloads!
+
+Press YELLOW to edit API keys."""
+
+HELP_LANGUAGES = """LANGUAGE CODES:
+
+IMPORTANT: SubDL uses UPPERCASE codes!
+
+2-letter codes (UPPERCASE for SubDL):
+• SR (Serbian), HR (Croatian), BS (Bosnian)
+• SL (Slovenian), EN (English), DE (German)
+• FR (French), ES (Spanish), IT (Italian)
+• RU (Russian), AR (Arabic), MK (Macedonian)
+
+Plugin automatically converts lowercase to uppercase for SubDL.
+
+Examples:
+• sr,hr,en (will be converted to SR,HR,EN for SubDL)
+• EN,DE,FR (use uppercase for clarity)"""
+
+HELP_DOWNLOAD_INFO = """DOWNLOAD LIMITS:
+
+SubDL:
+• UNLIMITED downloads
+• No daily restrictions
+• Best choice for heavy use
+• Requires API key from subdl.com
+
+OpenSubtitles.com:
+• Free: 5 downloads every 24 hours
+• VIP: 1000 downloads/day
+• Resets based on account time
+
+NEW in v1.4:
+• THREE search methods
+• SMART search (auto-tries all)
+• Shows which method worked
+• Better debugging
+
+RECOMMENDATION:
+Use SMART search for best results!"""
+
+HELP_SUBDL_OPTIONS = """SUBDL OPTIONS:
+
+Include releases: Show release info (DVDrip, HDTV, etc.)
+Include comments: Show uploader comments
+Full season search: Search for all episodes in season
+
+These options require SubDL API key to work."""
+
 class OpenSubtitlesConfigScreen(ConfigListScreen, Screen):
     """Ekran za konfiguraciju plugina - DODATE SUBDL OPCIJE"""
     
@@ -2001,10 +2618,7 @@ class OpenSubtitlesConfigScreen(ConfigListScreen, Screen):
         ConfigListScreen.__init__(self, [], session=session)
         self["config"].l.setItemHeight(40)
         
-        self["key_red"] = StaticText("Exit")
-        self["key_green"] = StaticText("Save")
-        self["key_yellow"] = StaticText("API Keys")
-        self["key_blue"] = StaticText("Select")
+        add_color_keys(self, "Exit", "Save", "API Keys", "Select")
         self["background"] = Pixmap()
         
         self["actions"] = ActionMap(["SetupActions", "ColorActions"],
@@ -2032,12 +2646,7 @@ class OpenSubtitlesConfigScreen(ConfigListScreen, Screen):
         self.list.append(getConfigListEntry("API Keys Setup:", self.api_keys_info))
         
         # Servisi
-        service_choices = [
-            ("both", "Both services (Recommended)"),
-            ("subdl", "SubDL only (Unlimited)"),
-            ("opensubtitles", "OpenSubtitles only")
-        ]
-        self.service_choice = ConfigSelection(choices=service_choices, 
+        self.service_choice = ConfigSelection(choices=SERVICE_CHOICES,
                                             default=self.settings.get('preferred_service', 'both'))
         self.list.append(getConfigListEntry("Search on:", self.service_choice))
         
@@ -2070,6 +2679,9 @@ class OpenSubtitlesConfigScreen(ConfigListScreen, Screen):
         
         self.subdl_full_season = ConfigYesNo(default=self.settings.get('subdl_full_season', False))
         self.list.append(getConfigListEntry("SubDL: Full season search:", self.subdl_full_season))
+
+        self.subdl_prefetch = ConfigYesNo(default=self.settings.get('subdl_prefetch', False))
+        self.list.append(getConfigListEntry("SubDL: Prefetch top results:", self.subdl_prefetch))
         
         # Ostale opcije
         self.auto_download = ConfigYesNo(default=self.settings.get('auto_download', False))
@@ -2078,8 +2690,7 @@ class OpenSubtitlesConfigScreen(ConfigListScreen, Screen):
         self.multi_lang_download = ConfigYesNo(default=self.settings.get('multi_lang_download', False))
         self.list.append(getConfigListEntry("Multi-language download:", self.multi_lang_download))
         
-        max_results_choices = [("20", "20"), ("30", "30"), ("50", "50"), ("100", "100")]
-        self.max_results = ConfigSelection(choices=max_results_choices, 
+        self.max_results = ConfigSelection(choices=MAX_RESULTS_CHOICES,
                                          default=str(self.settings.get('max_results', 50)))
         self.list.append(getConfigListEntry("Max results:", self.max_results))
         
@@ -2095,6 +2706,20 @@ class OpenSubtitlesConfigScreen(ConfigListScreen, Screen):
         self["config"].list = self.list
         self["config"].l.setList(self.list)
 
+        # Dispečer po identitetu config elementa (bez lanca == poređenja)
+        self.ok_handlers = {
+            id(self.languages): self.editLanguages,
+            id(self.save_path): self.editSavePath,
+            id(self.api_keys_info): boundFunction(self.showHelp, HELP_API_KEYS),
+            id(self.lang_examples): boundFunction(self.showHelp, HELP_LANGUAGES),
+            id(self.download_info): boundFunction(self.showHelp, HELP_DOWNLOAD_INFO),
+            id(self.subdl_options): boundFunction(self.showHelp, HELP_SUBDL_OPTIONS)
+        }
+        self.keyboard_targets = {
+            id(self.languages): self.languages,
+            id(self.save_path): self.save_path
+        }
+
     def clear_debug_files_func(self):
         """Obriši sve debug HTML fajlove"""
         try:
@@ -2123,94 +2748,38 @@ class OpenSubtitlesConfigScreen(ConfigListScreen, Screen):
         """Plavo dugme - Select / Edit"""
         current = self["config"].getCurrent()
         if current:
-            if current[1] == self.languages:
-                self.session.openWithCallback(
-                    self.VirtualKeyBoardCallback,
-                    VirtualKeyBoard,
-                    title="Enter languages (comma separated)\nExamples: sr,hr,en or EN,DE,FR\nNote: SubDL uses UPPERCASE codes",
-                    text=current[1].value
-                )
-            elif current[1] == self.save_path:
-                self.session.openWithCallback(
-                    self.VirtualKeyBoardCallback,
-                    VirtualKeyBoard,
-                    title="Enter save directory path",
-                    text=current[1].value
-                )
-            elif current[1] == self.api_keys_info:
-                help_text = """API KEYS CONFIGURATION:
+            handler = self.ok_handlers.get(id(current[1]))
+            if handler:
+                handler()
 
-1. OpenSubtitles.com API Key:
-   • Get from: https://www.opensubtitles.com
-   • Free account: 5 downloads/24h
-   • VIP account: 1000 downloads/day
+    def editLanguages(self):
+        self.session.openWithCallback(
+            self.VirtualKeyBoardCallback,
+            VirtualKeyBoard,
+            title="Enter languages (comma separated)\nExamples: sr,hr,en or EN,DE,FR\nNote: SubDL uses UPPERCASE codes",
+            text=self.languages.value
+        )
 
-2. SubDL API Key:
-   • Get from: https://subdl.com
-   • Registered account needed
-   • Unlimited downloads!
+    def editSavePath(self):
+        self.session.openWithCallback(
+            self.VirtualKeyBoardCallback,
+            VirtualKeyBoard,
+            title="Enter save directory path",
+            text=self.save_path.value
+        )
 
-Press YELLOW to edit API keys."""
-                self.session.open(MessageBox, help_text, MessageBox.TYPE_INFO)
-            elif current[1] == self.lang_examples:
-                help_text = """LANGUAGE CODES:
-
-IMPORTANT: SubDL uses UPPERCASE codes!
-
-2-letter codes (UPPERCASE for SubDL):
-• SR (Serbian), HR (Croatian), BS (Bosnian)
-• SL (Slovenian), EN (English), DE (German)
-• FR (French), ES (Spanish), IT (Italian)
-• RU (Russian), AR (Arabic), MK (Macedonian)
-
-Plugin automatically converts lowercase to uppercase for SubDL.
-
-Examples:
-• sr,hr,en (will be converted to SR,HR,EN for SubDL)
-• EN,DE,FR (use uppercase for clarity)"""
-                self.session.open(MessageBox, help_text, MessageBox.TYPE_INFO)
-            elif current[1] == self.download_info:
-                help_text = """DOWNLOAD LIMITS:
-
-SubDL:
-• UNLIMITED downloads
-• No daily restrictions
-• Best choice for heavy use
-• Requires API key from subdl.com
-
-OpenSubtitles.com:
-• Free: 5 downloads every 24 hours
-• VIP: 1000 downloads/day
-• Resets based on account time
-
-NEW in v1.4:
-• THREE search methods
-• SMART search (auto-tries all)
-• Shows which method worked
-• Better debugging
-
-RECOMMENDATION:
-Use SMART search for best results!"""
-                self.session.open(MessageBox, help_text, MessageBox.TYPE_INFO)
-            elif current[1] == self.subdl_options:
-                help_text = """SUBDL OPTIONS:
-
-Include releases: Show release info (DVDrip, HDTV, etc.)
-Include comments: Show uploader comments
-Full season search: Search for all episodes in season
+    def showHelp(self, help_text):
+        self.session.open(MessageBox, help_text, MessageBox.TYPE_INFO)
 
-These options require SubDL API key to work."""
-                self.session.open(MessageBox, help_text, MessageBox.TYPE_INFO)
     
     def VirtualKeyBoardCallback(self, callback=None):
         """Callback iz virtuelne tastature"""
         if callback is not None:
             current = self["config"].getCurrent()
             if current:
-                if current[1] == self.languages:
-                    self.languages.setValue(callback)
-                elif current[1] == self.save_path:
-                    self.save_path.setValue(callback)
+                target = self.keyboard_targets.get(id(current[1]))
+                if target is not None:
+                    target.setValue(callback)
     
     def keySave(self):
         """Zeleno dugme - Save"""
@@ -2235,15 +2804,16 @@ These options require SubDL API key to work."""
         self.settings['subdl_include_releases'] = self.subdl_include_releases.value
         self.settings['subdl_include_comments'] = self.subdl_include_comments.value
         self.settings['subdl_full_season'] = self.subdl_full_season.value
+        self.settings['subdl_prefetch'] = self.subdl_prefetch.value
         
         # Ako je save path prazan, koristi podrazumevani
         if not self.save_path.value.strip():
             self.settings['save_path'] = '/media/hdd/subtitles/'
         
-        if self.save_path.value and not pathExists(self.save_path.value):
+        if self.save_path.value:
             try:
-                createDir(self.save_path.value)
-            except:
+                os.makedirs(self.save_path.value, exist_ok=True)
+            except OSError:
                 self.session.open(MessageBox, 
                                 "Cannot create save directory!", 
                                 MessageBox.TYPE_ERROR)
@@ -2288,10 +2858,7 @@ class OpenSubtitlesApiKeysScreen(Screen):
         self.session = session
         self.plugin = plugin
         
-        self["key_red"] = StaticText("Exit")
-        self["key_green"] = StaticText("SubDL Key")
-        self["key_yellow"] = StaticText("OpenSubtitles")
-        self["key_blue"] = StaticText("Test Keys")
+        add_color_keys(self, "Exit", "SubDL Key", "OpenSubtitles", "Test Keys")
         self["info"] = Label("Edit API Keys for subtitle services")
         self["status"] = Label("")
         
@@ -2362,6 +2929,7 @@ class OpenSubtitlesApiKeysScreen(Screen):
             if self.config_obj.write_subdl_api_key(callback.strip()):
                 self.plugin.api.subdl_api_key = callback.strip()
                 self.plugin.api.subdl_api.set_api_key(callback.strip())
+                self.plugin.api.clear_results_cache()
                 self.updateStatus()
                 self["status"].setText("SubDL API Key saved successfully!\n\nMake sure to use UPPERCASE language codes (EN, SR, HR) for SubDL.")
                 self.status_timer = eTimer()
@@ -2385,6 +2953,7 @@ class OpenSubtitlesApiKeysScreen(Screen):
         if callback is not None and callback.strip():
             if self.config_obj.write_opensubtitles_api_key(callback.strip()):
                 self.plugin.api.opensubtitles_api_key = callback.strip()
+                self.plugin.api.clear_results_cache()
                 self.updateStatus()
                 self["status"].setText("OpenSubtitles API Key saved successfully!")
                 self.status_timer = eTimer()
@@ -2404,8 +2973,9 @@ class OpenSubtitlesApiKeysScreen(Screen):
         if subdl_key:
             test_results.append("Testing SubDL API Key...")
             try:
-                test_api = SubDLAPI()
+                test_api = SubDLAPI(session=HTTP_SESSION)
                 test_api.set_api_key(subdl_key)
+                test_api.set_timeout((3.05, 5))  # Brz test - ne čekaj zaglavljenu vezu
                 # Test search sa jednostavnim upitom i VELIKIM SLOVIMA
                 results = test_api.search("test", ["EN"], include_releases=True)
                 if results:
@@ -2419,6 +2989,8 @@ class OpenSubtitlesApiKeysScreen(Screen):
                         test_results.append(f"  File ID format: OK ({file_id[:20]}...)")
                     else:
                         test_results.append(f"  ⚠ File ID format may be incorrect")
+                elif isinstance(test_api.last_error, requests.exceptions.Timeout):
+                    test_results.append("✗ SubDL: Timeout (API slow or unreachable)")
                 else:
                     test_results.append("✗ SubDL: No results found (may be API key issue)")
                     test_results.append("  Check if API key is valid and language codes are UPPERCASE")
@@ -2435,8 +3007,8 @@ class OpenSubtitlesApiKeysScreen(Screen):
                     'Api-Key': opensub_key,
                     'User-Agent': 'Enigma2 Test'
                 }
-                response = requests.get("https://api.opensubtitles.com/api/v1/info", 
-                                       headers=headers, timeout=10)
+                response = HTTP_SESSION.get("https://api.opensubtitles.com/api/v1/info", 
+                                           headers=headers, timeout=HTTP_TIMEOUT)
                 if response.status_code == 200:
                     test_results.append("✓ OpenSubtitles: API Key VALID")
                     data = response.json()
@@ -2459,7 +3031,136 @@ class OpenSubtitlesApiKeysScreen(Screen):
         """Vrati originalni status tekst"""
         self.updateStatus()
 
-class OpenSubtitlesSearchScreen(Screen):
+class SubtitleSaveMixin:
+    """Zajedničko čuvanje titla, auto-mapiranje i poruke o grešci za ekrane pretrage.
+    Ekran treba da ima plugin, ready_dirs i video_files_cache."""
+
+    log_tag = "[SEARCH]"
+    auto_map = True  # Preimenuj snimljeni titl prema video fajlu istog naziva
+
+    def saveSubtitle(self, content, result, settings=None, batch=False):
+        """Snimi titl u pozadinskoj niti; vraća Deferred sa putanjom snimljenog fajla.
+        U batch režimu poruke o uspehu/grešci prikazuje pozivalac, jednom za sve fajlove."""
+        if settings is None:
+            settings = self.plugin.api.config.read_settings()
+        save_path = settings.get('save_path', '/media/hdd/subtitles/')
+
+        # Kreiraj naziv fajla
+        title = result.get('title', 'subtitle').replace(' ', '_')
+        title = title.translate(FILENAME_STRIP_TABLE)
+        language = result.get('language', 'unknown').lower()
+        site = result.get('site', 'unknown')
+        timestamp = SAVE_BASE_TS + next(SAVE_COUNTER)
+        
+        # Ekstenzija
+        ext = subtitle_extension(content)
+        
+        filename = f"{title}_{site}_{language}_{timestamp}{ext}"
+        full_path = f"{save_path.rstrip('/')}/{filename}"
+
+        # Upis ide u pozadinsku nit, GUI ostaje slobodan na sporom USB-u
+        self["status"].setText(f"Saving: {filename}")
+        d = defer_while_open(self, write_subtitle, full_path, content, save_path not in self.ready_dirs)
+        d.addCallback(self.subtitleWritten, save_path, full_path, title, settings)
+        if not batch:
+            d.addCallbacks(self.subtitleSaved, self.subtitleSaveFailed, callbackArgs=(filename,))
+        return d
+
+    def subtitleWritten(self, _, save_path, full_path, title, settings):
+        self.ready_dirs.add(save_path)
+
+        # Auto-map
+        if self.auto_map:
+            self.autoMapSubtitle(full_path, title, settings)
+        return full_path
+
+    def subtitleSaved(self, full_path, filename):
+        self["status"].setText(f"Downloaded: {filename}")
+        self.session.open(MessageBox,
+                          f"Subtitle downloaded successfully!\n\nSaved to: {full_path}",
+                          MessageBox.TYPE_INFO,
+                          timeout=5)
+
+    def subtitleSaveFailed(self, failure):
+        error = failure.getErrorMessage()
+        print(f"{self.log_tag} Error saving subtitle: {error}")
+        self["status"].setText(f"Error saving: {error}")
+        self.session.open(MessageBox,
+                          f"Error saving subtitle: {error}",
+                          MessageBox.TYPE_ERROR)
+
+    def getVideoFiles(self, sub_dir):
+        """Lista video fajlova u direktorijumu, keširana za trajanje ekrana"""
+        videos = self.video_files_cache.get(sub_dir)
+        if videos is None:
+            with os.scandir(sub_dir) as entries:
+                videos = [e.name for e in entries if e.name.lower().endswith(VIDEO_EXTENSIONS)]
+            self.video_files_cache[sub_dir] = videos
+        return videos
+
+    def autoMapSubtitle(self, subtitle_path, base_name, settings=None):
+        try:
+            sub_dir = os.path.dirname(subtitle_path)
+
+            if os.path.exists(sub_dir):
+                base_lower = base_name.lower()
+                for file in self.getVideoFiles(sub_dir):
+                    video_name = os.path.splitext(file)[0]
+                    video_lower = video_name.lower()
+                    if base_lower in video_lower or video_lower in base_lower:
+                        if settings is None:
+                            settings = self.plugin.api.config.read_settings()
+                        languages = settings.get('languages', ['srp'])
+                        lang_code = languages[0] if languages else 'srp'
+
+                        new_name = f"{video_name}.{lang_code}.srt"
+                        new_path = os.path.join(sub_dir, new_name)
+
+                        if rename_if_free(subtitle_path, new_path):
+                            print(f"{self.log_tag} Auto-mapped subtitle to: {new_name}")
+                            return True
+            return False
+        except Exception as e:
+            print(f"{self.log_tag} Auto-map error: {e}")
+            return False
+
+    def showDownloadError(self, site, file_id=""):
+        if site.lower() == 'subdl':
+            error_msg = f"""SubDL download failed!
+
+Possible reasons:
+1. Invalid or expired API key
+2. Subtitle removed from SubDL
+3. Network error or timeout
+4. Incorrect file_id format: {file_id}
+
+Solutions:
+• Check your SubDL API key in configuration
+• Try a different subtitle result
+• Ensure language codes are UPPERCASE (EN, SR, HR)
+• Try SMART search instead"""
+        elif site.lower() == 'opensubtitles':
+            error_msg = """OpenSubtitles download failed!
+
+Possible reasons:
+1. Daily limit reached (5 downloads for free)
+2. Invalid API key
+3. Subtitle removed
+
+Try again tomorrow or use SubDL for unlimited downloads."""
+        else:
+            error_msg = """Download failed!
+
+Check:
+1. API keys in configuration (both services)
+2. Internet connection
+3. Try different result
+4. Try SMART search"""
+        
+        self["status"].setText("Download failed!")
+        self.session.open(MessageBox, error_msg, MessageBox.TYPE_ERROR)
+
+class OpenSubtitlesSearchScreen(Screen, SubtitleSaveMixin):
     """Ekran za STANDARD pretragu titlova filmova"""
 
     skin = """
@@ -2498,10 +3199,14 @@ class OpenSubtitlesSearchScreen(Screen):
     </screen>
     """
 
+    log_tag = "[STANDARD SEARCH]"
+
     def __init__(self, session, plugin, initial_query=""):
         Screen.__init__(self, session)
         self.session = session
         self.plugin = plugin
+        self.ready_dirs = set()  # Direktorijumi za koje je makedirs već urađen
+        self.prefetched = {}  # file_id -> sadržaj unapred preuzetog titla
         self.initial_query = initial_query
 
         self["input_label"] = Label("Search:")
@@ -2511,13 +3216,18 @@ class OpenSubtitlesSearchScreen(Screen):
 
         self["results"] = MenuList([])
         self.results_list = []
+        self.searching = False
+        self.last_search_key = None
+        self.shown_items = None
+        self.video_files_cache = {}  # direktorijum -> lista video fajlova
 
-        self["actions"] = ActionMap(["ColorActions", "SetupActions", "MovieSelectionActions"],
+        self["actions"] = ActionMap(["ColorActions", "SetupActions", "MovieSelectionActions", "MenuActions"],
                                     {
                                         "red": self.close,
                                         "green": self.doSearch,
                                         "yellow": self.openKeyboard,
                                         "blue": self.downloadSelected,
+                                        "menu": self.refreshSearch,
                                         "cancel": self.close,
                                         "ok": self.downloadSelected,
                                         "up": self.up,
@@ -2534,9 +3244,9 @@ class OpenSubtitlesSearchScreen(Screen):
     def updateDisplay(self):
         search_text = self["input"].getText()
         if not search_text or not search_text.strip():
-            self["status"].setText("STANDARD Search - Uses Film Name only")
+            set_text(self["status"], "STANDARD Search - Uses Film Name only")
         else:
-            self["status"].setText(f"STANDARD search: {search_text[:30]}...")
+            set_text(self["status"], f"STANDARD search: {search_text[:30]}...")
 
     def openKeyboard(self):
         current_text = self["input"].getText()
@@ -2555,137 +3265,188 @@ class OpenSubtitlesSearchScreen(Screen):
             if cleaned_text:
                 self.doSearch()
 
+    def refreshSearch(self):
+        """MENU - ponovi pretragu mimo keša rezultata"""
+        if self.searching:
+            self["status"].setText("Search in progress...")
+            return
+        self.plugin.api.clear_results_cache()
+        self.last_search_key = None
+        self.doSearch()
+
     def doSearch(self):
+        if self.searching:
+            self["status"].setText("Search in progress...")
+            return
+
         query = self["input"].getText().strip()
         if not query:
             self["status"].setText("Please enter search term")
             return
 
-        self["status"].setText(f"STANDARD searching: '{query}'...")
-
         settings = self.plugin.api.config.read_settings()
         languages = settings.get('languages', ['sr', 'hr'])
         service = settings.get('preferred_service', 'both')
 
+        # Isti upit kao prethodni - lista je već prikazana
+        search_key = (query.lower(), tuple(sorted(languages)), service)
+        if search_key == self.last_search_key and self.results_list:
+            self["status"].setText("Results already shown - press MENU to search again")
+            return
+        self.last_search_key = search_key
+
+        self["status"].setText(f"STANDARD searching: '{query}'...")
+
         print(f"[STANDARD SEARCH] Searching for: '{query}'")
         print(f"[STANDARD SEARCH] Languages: {languages}")
         print(f"[STANDARD SEARCH] Service: {service}")
 
-        # Koristimo STANDARD API (film_name samo)
-        results = self.plugin.api.search_all(query, languages)
+        # Koristimo STANDARD API (film_name samo) - u pozadinskoj niti da GUI ne zablokira
+        self.searching = True
+        defer_while_open(self, self.plugin.api.search_all, query, languages).addCallbacks(
+            self.searchDone, self.searchFailed)
+
+    def setResultList(self, list_items):
+        """Osveži listu samo ako se sadržaj promenio"""
+        if list_items != self.shown_items:
+            self.shown_items = list_items
+            self["results"].setList(list_items)
 
+    def searchFailed(self, failure):
+        self.searching = False
+        self.last_search_key = None
+        print(f"[STANDARD SEARCH] Error: {failure.getErrorMessage()}")
+        self["status"].setText("STANDARD search failed!")
+
+    def searchDone(self, results):
+        self.searching = False
         print(f"[STANDARD SEARCH] Got {len(results)} results")
 
-        self.results_list = results or []
+        # Ukloni duplikate pre formatiranja liste
+        self.results_list = unique_results(results or [])
+        removed = len(results or []) - len(self.results_list)
+        if removed:
+            print(f"[STANDARD SEARCH] Removed {removed} duplicate results")
         
         if not self.results_list:
             list_items = ["No results found with STANDARD search"]
-            self["results"].setList(list_items)
+            self.setResultList(list_items)
             self["status"].setText("STANDARD search: No subtitles found.")
             return
 
-        list_items = []
-        
-        for idx, result in enumerate(self.results_list, 1):
-            title = result.get('title', 'Unknown Title')
-            language = result.get('language', 'Unknown').upper()
-            site = result.get('site', '').upper()
-            
-            # Oznaka servisa
-            if site == 'SUBDL':
-                site_indicator = "[SubDL] "
-                service_color = " (Unlimited)"
-            elif site == 'OPENSUBTITLES':
-                site_indicator = "[OS] "
-                service_color = " (5/day)"
-            else:
-                site_indicator = ""
-                service_color = ""
-            
-            year = result.get('year', '')
-            year_prefix = f"{year} - " if year and str(year).isdigit() else ""
-
-            # Skrati naslov
-            display_title = title[:40]
-            if len(title) > 40:
-                display_title = title[:37] + "..."
-
-            display_text = f"{idx}. {site_indicator}{year_prefix}{display_title}"
-            
-            # Info delovi
-            info_parts = []
-            
-            # Dodaj jezik
-            info_parts.append(f"Lang: {language}")
-            
-            # Dodaj FPS samo za OpenSubtitles
-            if site == 'OPENSUBTITLES':
-                fps = result.get('fps')
-                if fps and fps > 0:
-                    info_parts.append(f"FPS: {fps}")
-            
-            # Dodaj broj download-a
-            downloads = result.get('downloads', 0)
-            if downloads > 0:
-                # Formatiraj broj
-                if downloads >= 1000000:
-                    dl_str = f"{downloads/1000000:.1f}M"
-                elif downloads >= 1000:
-                    dl_str = f"{downloads/1000:.1f}K"
-                else:
-                    dl_str = str(downloads)
-                info_parts.append(f"↓{dl_str}")
-            
-            # Dodaj rating
-            rating = result.get('rating', 0)
-            if rating and rating > 0:
-                info_parts.append(f"⭐{rating:.1f}")
-            
-            # Dodaj HD oznaku
-            if result.get('hd'):
-                info_parts.append("HD")
-            
-            # Dodaj HI oznaku
-            if result.get('hearing_impaired'):
-                info_parts.append("HI")
-            
-            # Dodaj service info
-            if service_color:
-                info_parts.append(service_color)
-            
-            # Dodaj release info
-            release = result.get('release_info', '')
-            if release and len(release) < 20:
-                display_text += f" - {release}"
-            
-            # Dodaj info delove
-            if info_parts:
-                display_text += f" ({' | '.join(info_parts)})"
-            
-            list_items.append(display_text)
+        # Redovi liste i statistika po sajtu u jednom prolazu
+        site_counts = Counter()
+        list_items = [None] * len(self.results_list)
+        for idx, result in enumerate(self.results_list):
+            site_counts[result.get('site', 'Unknown')] += 1
+            list_items[idx] = self.formatResultRow(idx + 1, result)
 
-        self["results"].setList(list_items)
+        self.setResultList(list_items)
 
         # Prikaži statistiku
-        site_counts = {}
-        for result in self.results_list:
-            site = result.get('site', 'Unknown')
-            site_counts[site] = site_counts.get(site, 0) + 1
-        
         total_results = len(self.results_list)
         
         # Ako ima SubDL rezultata, istakni ih
-        subdl_count = site_counts.get('subdl', 0)
-        opensub_count = site_counts.get('opensubtitles', 0)
+        subdl_count = site_counts['subdl']
+        opensub_count = site_counts['opensubtitles']
         
         if subdl_count > 0 and opensub_count > 0:
-            self["status"].setText(f"STANDARD: {total_results} results ({subdl_count} SubDL, {opensub_count} OpenSubtitles)")
+            status_text = f"STANDARD: {total_results} results ({subdl_count} SubDL, {opensub_count} OpenSubtitles)"
         elif subdl_count > 0:
-            self["status"].setText(f"STANDARD: {total_results} results (All from SubDL)")
+            status_text = f"STANDARD: {total_results} results (All from SubDL)"
         elif opensub_count > 0:
-            self["status"].setText(f"STANDARD: {total_results} results (All from OpenSubtitles)")
+            status_text = f"STANDARD: {total_results} results (All from OpenSubtitles)"
         else:
-            self["status"].setText(f"STANDARD: {total_results} results")
+            status_text = f"STANDARD: {total_results} results"
+
+        if removed:
+            status_text += f", {removed} duplicates hidden"
+        self["status"].setText(status_text)
+
+        self.prefetchTop()
+
+    def prefetchTop(self):
+        """Preuzmi prve SubDL titlove u pozadini dok korisnik bira (samo uz podešavanje
+        subdl_prefetch - troši protok i SubDL kvotu i kad se ništa ne preuzme).
+        Samo SubDL - OpenSubtitles ima dnevni limit preuzimanja."""
+        self.prefetched = {}
+        if not self.plugin.api.config.read_settings().get('subdl_prefetch', False):
+            return
+        candidates = [r for r in self.results_list
+                      if r.get('site') == 'subdl' and r.get('file_id')][:PREFETCH_COUNT]
+        if not candidates:
+            return
+        results_list = self.results_list
+        defer_while_open(self, self.fetchPrefetch, candidates).addCallbacks(
+            self.prefetchDone, self.prefetchFailed, callbackArgs=(results_list,))
+
+    def fetchPrefetch(self, candidates):
+        contents = list(SEARCH_POOL.map(self.plugin.api.download, candidates))
+        return [(r['file_id'], content) for r, content in zip(candidates, contents) if content]
+
+    def prefetchDone(self, fetched, results_list):
+        # Rezultati starije pretrage se odbacuju
+        if results_list is self.results_list:
+            self.prefetched.update(fetched)
+            print(f"[STANDARD SEARCH] Prefetched {len(fetched)} subtitles")
+
+    def prefetchFailed(self, failure):
+        print(f"[STANDARD SEARCH] Prefetch error: {failure.getErrorMessage()}")
+
+    def formatResultRow(self, idx, result):
+        """Tekst jednog reda u listi rezultata"""
+        get = result.get
+        title = get('title', 'Unknown Title')
+        language = get('language', 'Unknown').upper()
+        site = get('site', '').upper()
+
+        # Oznaka servisa
+        site_indicator, service_color = SITE_INDICATORS.get(site, ("", ""))
+
+        year = get('year', '')
+        year_prefix = f"{year} - " if year and str(year).isdigit() else ""
+
+        # Skrati naslov
+        display_title = title if len(title) <= 40 else title[:37] + "..."
+
+        parts = [f"{idx}. {site_indicator}{year_prefix}{display_title}"]
+
+        # Info delovi - jezik je uvek prisutan
+        info_parts = [f"Lang: {language}"]
+
+        # Dodaj FPS samo za OpenSubtitles
+        if site == 'OPENSUBTITLES':
+            fps = get('fps')
+            if fps and fps > 0:
+                info_parts.append(f"FPS: {fps}")
+
+        # Dodaj broj download-a
+        downloads = get('downloads', 0)
+        if downloads > 0:
+            info_parts.append(f"↓{format_downloads(downloads)}")
+
+        # Dodaj rating
+        rating = get('rating', 0)
+        if rating and rating > 0:
+            info_parts.append(f"⭐{rating:.1f}")
+
+        # Dodaj HD / HI oznaku
+        if get('hd'):
+            info_parts.append("HD")
+        if get('hearing_impaired'):
+            info_parts.append("HI")
+
+        # Dodaj service info
+        if service_color:
+            info_parts.append(service_color)
+
+        # Dodaj release info
+        release = get('release_info', '')
+        if release and len(release) < 20:
+            parts.append(f" - {release}")
+
+        parts.append(f" ({' | '.join(info_parts)})")
+        return ''.join(parts)
 
     def downloadSelected(self):
         selected_idx = self["results"].getSelectedIndex()
@@ -2707,172 +3468,99 @@ class OpenSubtitlesSearchScreen(Screen):
         multi_lang = settings.get('multi_lang_download', False)
         priority_language = settings.get('priority_language', 'first')
 
+        # Postavke se čitaju jednom po akciji i prosleđuju dalje
         if multi_lang and priority_language == 'all':
-            self.downloadAllLanguages(result)
+            self.downloadAllLanguages(result, settings)
         else:
-            self.downloadSingleSubtitle(result)
+            self.downloadSingleSubtitle(result, settings)
 
-    def downloadSingleSubtitle(self, result):
+    def downloadSingleSubtitle(self, result, settings=None):
         print(f"[STANDARD SEARCH] Downloading from {result.get('site', 'unknown')}")
         print(f"[STANDARD SEARCH] File ID: {result.get('file_id', 'N/A')}")
 
-        content = self.plugin.api.download(result)
+        content = None
+        if result.get('site') == 'subdl':
+            content = self.prefetched.pop(result.get('file_id'), None)
+        if content is None:
+            content = self.plugin.api.download(result)
         
         if content:
-            self.saveSubtitle(content, result)
+            self.saveSubtitle(content, result, settings)
         else:
             self.showDownloadError(result.get('site', 'Unknown'), result.get('file_id', 'N/A'))
 
-    def downloadAllLanguages(self, result):
+    def downloadAllLanguages(self, result, settings=None):
         print(f"[STANDARD SEARCH] Downloading all languages")
 
         title = result.get('title', 'Unknown')
         self["status"].setText(f"Searching all languages for: {title[:30]}...")
 
-        settings = self.plugin.api.config.read_settings()
+        if settings is None:
+            settings = self.plugin.api.config.read_settings()
         languages = settings.get('languages', ['sr', 'hr'])
 
         if 'all' in languages:
             languages = ['sr', 'hr', 'bs', 'sl', 'en']
 
-        downloaded_count = 0
-
-        for lang in languages:
-            # Pretraži za svaki jezik
-            search_results = self.plugin.api.search_all(title, [lang])
-            
-            if search_results:
-                # Preuzmi prvi rezultat za ovaj jezik
-                for sub_result in search_results:
-                    if sub_result.get('language', '').lower().startswith(lang[:2]):
-                        content = self.plugin.api.download(sub_result)
-                        if content:
-                            self.saveSubtitle(content, sub_result)
-                            downloaded_count += 1
-                            break
-
-        if downloaded_count > 0:
-            self["status"].setText(f"Downloaded {downloaded_count} language(s)")
-            self.session.open(MessageBox,
-                              f"Successfully downloaded {downloaded_count} subtitle(s)!",
-                              MessageBox.TYPE_INFO,
-                              timeout=5)
-        else:
-            self.showDownloadError("all", "")
+        # Jezici se pretražuju paralelno, svaki u svojoj pozadinskoj niti (Twisted pool, ne
+        # SEARCH_POOL - search_all unutra koristi SEARCH_POOL i čeka ga)
+        fetches = [defer_while_open(self, self.fetchFirstForLang, title, lang) for lang in languages]
+        DeferredList(fetches, consumeErrors=True).addCallback(
+            self.allLanguagesFetched, languages, settings)
 
-    def saveSubtitle(self, content, result):
-        settings = self.plugin.api.config.read_settings()
-        save_path = settings.get('save_path', '/media/hdd/subtitles/')
+    def fetchFirstForLang(self, title, lang):
+        """Pretraži i preuzmi prvi titl za jedan jezik (izvršava se u radnoj niti)"""
+        search_results = self.plugin.api.search_all(title, [lang])
 
-        # Kreiraj naziv fajla
-        title = result.get('title', 'subtitle').replace(' ', '_')
-        title = re.sub(r'[^\w\-_]', '', title)
-        language = result.get('language', 'unknown').lower()
-        site = result.get('site', 'unknown')
-        timestamp = int(time.time())
-        
-        # Ekstenzija
-        ext = '.srt'
-        if isinstance(content, bytes):
-            if content.startswith(b'WEBVTT'):
-                ext = '.vtt'
-            elif content.startswith(b'1\r\n0'):
-                ext = '.sub'
-            elif b'[Script Info]' in content[:100]:
-                ext = '.ass'
-        
-        filename = f"{title}_{site}_{language}_{timestamp}{ext}"
-        full_path = os.path.join(save_path, filename)
-
-        try:
-            if not pathExists(save_path):
-                createDir(save_path)
+        # Preuzmi prvi rezultat za ovaj jezik
+        for sub_result in search_results:
+            if sub_result.get('language', '').lower().startswith(lang[:2]):
+                content = self.plugin.api.download(sub_result)
+                if content:
+                    return content, sub_result
+        return None
 
-            if isinstance(content, str):
-                content = content.encode('utf-8')
+    def allLanguagesFetched(self, outcomes, languages, settings):
+        """Skupi (content, result) parove po redu jezika - greška jednog jezika ne odbacuje ostale"""
+        downloads = []
+        for lang, (success, value) in zip(languages, outcomes):
+            if not success:
+                print(f"[STANDARD SEARCH] Language {lang} failed: {value.getErrorMessage()}")
+            elif value:
+                downloads.append(value)
+        self.allLanguagesDone(downloads, settings)
+
+    def allLanguagesDone(self, downloads, settings=None):
+        if not downloads:
+            self.showDownloadError("all", "")
+            return
 
-            with open(full_path, 'wb') as f:
-                f.write(content)
+        # Upisi idu u pozadini - izveštaj se prikazuje jednom, kad se svi završe
+        self["status"].setText(f"Saving {len(downloads)} subtitle(s)...")
+        saves = [self.saveSubtitle(content, sub_result, settings, batch=True)
+                 for content, sub_result in downloads]
+        DeferredList(saves, consumeErrors=True).addCallback(self.allLanguagesSaved)
+
+    def allLanguagesSaved(self, outcomes):
+        saved_count = 0
+        for success, value in outcomes:
+            if success:
+                saved_count += 1
+            else:
+                print(f"[STANDARD SEARCH] Error saving subtitle: {value.getErrorMessage()}")
 
-            self["status"].setText(f"Downloaded: {filename}")
-            
-            # Auto-map
-            self.autoMapSubtitle(full_path, title)
-            
+        if saved_count > 0:
+            self["status"].setText(f"Downloaded {saved_count} language(s)")
             self.session.open(MessageBox,
-                              f"Subtitle downloaded successfully!\n\nSaved to: {full_path}",
+                              f"Successfully downloaded {saved_count} of {len(outcomes)} subtitle(s)!",
                               MessageBox.TYPE_INFO,
                               timeout=5)
-
-        except Exception as e:
-            print(f"[STANDARD SEARCH] Error saving subtitle: {e}")
-            self["status"].setText(f"Error saving: {str(e)}")
+        else:
+            self["status"].setText("Error saving subtitles!")
             self.session.open(MessageBox,
-                              f"Error saving subtitle: {str(e)}",
+                              "Error saving subtitles - none of the files could be written!",
                               MessageBox.TYPE_ERROR)
 
-    def autoMapSubtitle(self, subtitle_path, base_name):
-        try:
-            video_extensions = ['.mkv', '.mp4', '.avi', '.ts', '.mov', '.m2ts']
-            sub_dir = os.path.dirname(subtitle_path)
-
-            if os.path.exists(sub_dir):
-                for file in os.listdir(sub_dir):
-                    if any(file.lower().endswith(ext) for ext in video_extensions):
-                        video_name = os.path.splitext(file)[0]
-                        if base_name.lower() in video_name.lower() or video_name.lower() in base_name.lower():
-                            settings = self.plugin.api.config.read_settings()
-                            languages = settings.get('languages', ['srp'])
-                            lang_code = languages[0] if languages else 'srp'
-
-                            new_name = f"{video_name}.{lang_code}.srt"
-                            new_path = os.path.join(sub_dir, new_name)
-
-                            if not os.path.exists(new_path):
-                                os.rename(subtitle_path, new_path)
-                                print(f"[STANDARD SEARCH] Auto-mapped subtitle to: {new_name}")
-                                return True
-            return False
-        except Exception as e:
-            print(f"[STANDARD SEARCH] Auto-map error: {e}")
-            return False
-
-    def showDownloadError(self, site, file_id=""):
-        if site.lower() == 'subdl':
-            error_msg = f"""SubDL download failed!
-
-Possible reasons:
-1. Invalid or expired API key
-2. Subtitle removed from SubDL
-3. Network error or timeout
-4. Incorrect file_id format: {file_id}
-
-Solutions:
-• Check your SubDL API key in configuration
-• Try a different subtitle result
-• Ensure language codes are UPPERCASE (EN, SR, HR)
-• Try SMART search instead"""
-        elif site.lower() == 'opensubtitles':
-            error_msg = """OpenSubtitles download failed!
-
-Possible reasons:
-1. Daily limit reached (5 downloads for free)
-2. Invalid API key
-3. Subtitle removed
-
-Try again tomorrow or use SubDL for unlimited downloads."""
-        else:
-            error_msg = """Download failed!
-
-Check:
-1. API keys in configuration (both services)
-2. Internet connection
-3. Try different result
-4. Try SMART search"""
-        
-        self["status"].setText("Download failed!")
-        self.session.open(MessageBox, error_msg, MessageBox.TYPE_ERROR)
-
     def up(self):
         if self["results"].getList():
             self["results"].up()
@@ -2939,6 +3627,7 @@ class OpenSubtitlesSmartSearchScreen(Screen):
         Screen.__init__(self, session)
         self.session = session
         self.plugin = plugin
+        self.ready_dirs = set()  # Direktorijumi za koje je makedirs već urađen
         self.initial_query = initial_query
 
         self["header"] = Label("SMART SEARCH - Tries IMDB → File Name → Film Name")
@@ -2950,13 +3639,17 @@ class OpenSubtitlesSmartSearchScreen(Screen):
 
         self["results"] = MenuList([])
         self.results_list = []
+        self.searching = False
+        self.last_search_key = None
+        self.shown_items = None
 
-        self["actions"] = ActionMap(["ColorActions", "SetupActions", "MovieSelectionActions"],
+        self["actions"] = ActionMap(["ColorActions", "SetupActions", "MovieSelectionActions", "MenuActions"],
                                     {
                                         "red": self.close,
                                         "green": self.doSearch,
                                         "yellow": self.openKeyboard,
                                         "blue": self.downloadSelected,
+                                        "menu": self.refreshSearch,
                                         "cancel": self.close,
                                         "ok": self.downloadSelected,
                                         "up": self.up,
@@ -3000,9 +3693,9 @@ Logs show which method found each result!"""
     def updateDisplay(self):
         search_text = self["input"].getText()
         if not search_text or not search_text.strip():
-            self["status"].setText("Enter search term for SMART search")
+            set_text(self["status"], "Enter search term for SMART search")
         else:
-            self["status"].setText(f"Ready for SMART search: {search_text[:30]}...")
+            set_text(self["status"], f"Ready for SMART search: {search_text[:30]}...")
     
     def openKeyboard(self):
         current_text = self["input"].getText()
@@ -3021,49 +3714,88 @@ Logs show which method found each result!"""
             if cleaned_text:
                 self.doSearch()
     
+    def refreshSearch(self):
+        """MENU - ponovi pretragu mimo keša rezultata"""
+        if self.searching:
+            self["status"].setText("Search in progress...")
+            return
+        self.plugin.api.clear_results_cache()
+        self.last_search_key = None
+        self.doSearch()
+
     def doSearch(self):
+        if self.searching:
+            self["status"].setText("Search in progress...")
+            return
+
         query = self["input"].getText().strip()
         if not query:
             self["status"].setText("Please enter search term")
             return
 
-        self["status"].setText(f"SMART searching: '{query}'...")
-
         settings = self.plugin.api.config.read_settings()
         languages = settings.get('languages', ['sr', 'hr'])
+        service = settings.get('preferred_service', 'both')
+
+        # Isti upit kao prethodni - lista je već prikazana
+        search_key = (query.lower(), tuple(sorted(languages)), service)
+        if search_key == self.last_search_key and self.results_list:
+            self["status"].setText("Results already shown - press MENU to search again")
+            return
+        self.last_search_key = search_key
+
+        self["status"].setText(f"SMART searching: '{query}'...")
 
         print(f"[SMART SEARCH] Starting smart search for: '{query}'")
         
-        # KORISTI NOVU SMART SEARCH METODU
-        results = self.plugin.api.search_all_smart(query, languages)
+        # KORISTI NOVU SMART SEARCH METODU - u pozadinskoj niti da GUI ne zablokira
+        self.searching = True
+        defer_while_open(self, self.plugin.api.search_all_smart, query, languages).addCallbacks(
+            self.searchDone, self.searchFailed)
+
+    def setResultList(self, list_items):
+        """Osveži listu samo ako se sadržaj promenio"""
+        if list_items != self.shown_items:
+            self.shown_items = list_items
+            self["results"].setList(list_items)
+
+    def searchFailed(self, failure):
+        self.searching = False
+        self.last_search_key = None
+        print(f"[SMART SEARCH] Error: {failure.getErrorMessage()}")
+        self["status"].setText("SMART search failed!")
 
+    def searchDone(self, results):
+        self.searching = False
         print(f"[SMART SEARCH] Got {len(results)} results from smart search")
 
         self.results_list = results or []
         
         if not self.results_list:
             list_items = ["No results found with SMART search"]
-            self["results"].setList(list_items)
+            self.setResultList(list_items)
             self["status"].setText("SMART search: No subtitles found.")
             return
 
-        list_items = []
+        # Redovi liste i statistika po metodu u jednom prolazu
+        method_counts = {'imdb': 0, 'file_name': 0, 'film_name': 0, 'opensubtitles': 0}
+        list_items = [None] * len(self.results_list)
         
         for idx, result in enumerate(self.results_list, 1):
-            title = result.get('title', 'Unknown Title')
-            language = result.get('language', 'Unknown').upper()
-            site = result.get('site', '').upper()
-            method = result.get('search_method', '').upper()
+            get = result.get
+            title = get('title', 'Unknown Title')
+            language = get('language', 'Unknown').upper()
+            site = get('site', '').upper()
+            method_key = get('search_method', '').lower()
+            method = method_key.upper()
+            
+            if site == 'OPENSUBTITLES':
+                method_counts['opensubtitles'] += 1
+            elif method_key in method_counts:
+                method_counts[method_key] += 1
             
             # Oznaka kvaliteta
-            quality_indicator = ""
-            if site == 'SUBDL':
-                if method == 'IMDB':
-                    quality_indicator = "⭐ "  # Najbolje
-                elif method == 'FILE_NAME':
-                    quality_indicator = "✓ "   # Dobro
-                elif method == 'FILM_NAME':
-                    quality_indicator = "~ "   # OK
+            quality_indicator = SMART_QUALITY_INDICATORS.get(method, "") if site == 'SUBDL' else ""
             
             display_text = f"{idx}. {quality_indicator}{title[:45]}"
             if len(title) > 45:
@@ -3077,54 +3809,31 @@ Logs show which method found each result!"""
                 info_parts.append(f"Via: {method}")
             
             # Downloads
-            downloads = result.get('downloads', 0)
+            downloads = get('downloads', 0)
             if downloads > 0:
-                if downloads >= 1000000:
-                    dl_str = f"{downloads/1000000:.1f}M"
-                elif downloads >= 1000:
-                    dl_str = f"{downloads/1000:.1f}K"
-                else:
-                    dl_str = str(downloads)
-                info_parts.append(f"↓{dl_str}")
+                info_parts.append(f"↓{format_downloads(downloads)}")
             
             # HD/HI
-            if result.get('hd'):
+            if get('hd'):
                 info_parts.append("HD")
-            if result.get('hearing_impaired'):
+            if get('hearing_impaired'):
                 info_parts.append("HI")
             
             # Release info
-            release = result.get('release_info', '')
+            release = get('release_info', '')
             if release and len(release) < 20:
                 display_text += f" - {release}"
             
             if info_parts:
                 display_text += f" ({' | '.join(info_parts)})"
             
-            list_items.append(display_text)
+            list_items[idx - 1] = display_text
 
-        self["results"].setList(list_items)
+        self.setResultList(list_items)
 
         # Prikaži statistiku
-        method_counts = {'imdb': 0, 'file_name': 0, 'film_name': 0, 'opensubtitles': 0}
-        for result in self.results_list:
-            method = result.get('search_method', '').lower()
-            site = result.get('site', '').lower()
-            
-            if site == 'opensubtitles':
-                method_counts['opensubtitles'] += 1
-            elif method in method_counts:
-                method_counts[method] += 1
-        
-        stats_parts = []
-        if method_counts['imdb'] > 0:
-            stats_parts.append(f"⭐IMDB: {method_counts['imdb']}")
-        if method_counts['file_name'] > 0:
-            stats_parts.append(f"✓File: {method_counts['file_name']}")
-        if method_counts['film_name'] > 0:
-            stats_parts.append(f"~Film: {method_counts['film_name']}")
-        if method_counts['opensubtitles'] > 0:
-            stats_parts.append(f"OS: {method_counts['opensubtitles']}")
+        stats_parts = [f"{label}: {method_counts[key]}"
+                       for key, label in SMART_STATS_LABELS if method_counts[key]]
         
         total = len(self.results_list)
         stats_text = " + ".join(stats_parts) if stats_parts else "No results"
@@ -3143,9 +3852,7 @@ Logs show which method found each result!"""
         title = result.get('title', 'Unknown')
         
         # Ukloni quality indicator iz naslova ako postoji
-        clean_title = title
-        if title.startswith(('⭐ ', '✓ ', '~ ')):
-            clean_title = title[2:]
+        clean_title = title[2:] if title[:2] in QUALITY_PREFIXES else title
         
         file_id = result.get('file_id', 'N/A')
         method = result.get('search_method', 'unknown')
@@ -3167,34 +3874,21 @@ Logs show which method found each result!"""
 
         # Kreiraj naziv fajla
         title = result.get('title', 'subtitle').replace(' ', '_')
-        title = re.sub(r'[^\w\-_]', '', title)
+        title = title.translate(FILENAME_STRIP_TABLE)
         language = result.get('language', 'unknown').lower()
         site = result.get('site', 'unknown')
         method = result.get('search_method', 'unknown')
-        timestamp = int(time.time())
+        timestamp = SAVE_BASE_TS + next(SAVE_COUNTER)
         
         # Ekstenzija
-        ext = '.srt'
-        if isinstance(content, bytes):
-            if content.startswith(b'WEBVTT'):
-                ext = '.vtt'
-            elif content.startswith(b'1\r\n0'):
-                ext = '.sub'
-            elif b'[Script Info]' in content[:100]:
-                ext = '.ass'
+        ext = subtitle_extension(content)
         
         filename = f"{title}_{site}_{method}_{language}_{timestamp}{ext}"
-        full_path = os.path.join(save_path, filename)
+        full_path = f"{save_path.rstrip('/')}/{filename}"
 
         try:
-            if not pathExists(save_path):
-                createDir(save_path)
-
-            if isinstance(content, str):
-                content = content.encode('utf-8')
-
-            with open(full_path, 'wb') as f:
-                f.write(content)
+            write_subtitle(full_path, content, save_path not in self.ready_dirs)
+            self.ready_dirs.add(save_path)
 
             self["status"].setText(f"Downloaded: {filename}")
             
@@ -3254,7 +3948,7 @@ Try SMART search again or use different method."""
         if self["results"].getList():
             self["results"].pageDown()
 
-class OpenSubtitlesAdvancedSearchScreen(Screen):
+class OpenSubtitlesAdvancedSearchScreen(Screen, SubtitleSaveMixin):
     """Ekran za naprednu pretragu - ADVANCED SEARCH"""
     
     skin = """
@@ -3297,10 +3991,15 @@ class OpenSubtitlesAdvancedSearchScreen(Screen):
     </screen>
     """
     
+    log_tag = "[ADVANCED SEARCH]"
+    auto_map = False  # Ovaj ekran nikad nije preimenovao titlove prema video fajlu
+
     def __init__(self, session, plugin):
         Screen.__init__(self, session)
         self.session = session
         self.plugin = plugin
+        self.ready_dirs = set()  # Direktorijumi za koje je makedirs već urađen
+        self.video_files_cache = {}  # direktorijum -> lista video fajlova
         
         self["header"] = Label("ADVANCED SEARCH - Manual choice use ↑↓ arrows")
         self["search_type_label"] = Label("Search by:")
@@ -3334,13 +4033,13 @@ class OpenSubtitlesAdvancedSearchScreen(Screen):
     
     def updateDisplay(self):
         search_type = self.search_types[self.current_search_type]
-        self["search_type"].setText(search_type)
+        set_text(self["search_type"], search_type)
         
         query = self["query"].getText()
         if query:
-            self["status"].setText(f"Ready: {search_type} = {query[:30]}")
+            set_text(self["status"], f"Ready: {search_type} = {query[:30]}")
         else:
-            self["status"].setText(f"Enter {search_type.lower()} and press GREEN to search")
+            set_text(self["status"], f"Enter {search_type.lower()} and press GREEN to search")
     
     def openKeyboard(self):
         """Otvaranje tastature za unos pretrage"""
@@ -3400,11 +4099,8 @@ class OpenSubtitlesAdvancedSearchScreen(Screen):
                     smart_results = self.plugin.api.search_all_smart(query, languages)
 
                     # Filtrirati samo IMDB rezultate
-                    imdb_results = []
-                    for result in smart_results:
-                        method = result.get('search_method', '').lower()
-                        if method == 'imdb':
-                            imdb_results.append(result)
+                    imdb_results = [r for r in smart_results
+                                    if r.get('search_method', '').lower() == 'imdb']
 
                     results = imdb_results if imdb_results else smart_results
 
@@ -3428,11 +4124,8 @@ class OpenSubtitlesAdvancedSearchScreen(Screen):
             if not results:
                 # Probaj smart search kao fallback
                 smart_results = self.plugin.api.search_all_smart(query, languages)
-                file_results = []
-                for result in smart_results:
-                    method = result.get('search_method', '').lower()
-                    if method == 'file_name':
-                        file_results.append(result)
+                file_results = [r for r in smart_results
+                                if r.get('search_method', '').lower() == 'file_name']
 
                 results = file_results if file_results else smart_results
 
@@ -3452,91 +4145,30 @@ class OpenSubtitlesAdvancedSearchScreen(Screen):
             if "IMDB ID" in search_type:
                 self["status"].setText(f"No subtitles found for IMDB ID: {query}")
             else:
-                self["status"].setText("No subtitles found. Try different search.")
-            return
-
-        # Prikaži rezultate (isti kod kao prethodno)
-        list_items = []
-        for idx, result in enumerate(self.results_list, 1):
-            title = result.get('title', 'Unknown')
-            site = result.get('site', '').upper()
-            method = result.get('search_method', '').upper()
-
-            method_icon = ""
-            if method == 'IMDB' or method == 'IMDB_DIRECT':
-                method_icon = "⭐ "
-            elif method == 'FILE_NAME':
-                method_icon = "📁 "
-            elif method == 'FILM_NAME':
-                method_icon = "🎬 "
-
-            site_indicator = f"[{site}] " if site else ""
-
-            display_title = title[:45]
-            if len(title) > 45:
-                display_title = title[:42] + "..."
-
-            display_text = f"{idx}. {method_icon}{site_indicator}{display_title}"
-
-            info_parts = []
-            language = result.get('language', 'Unknown').upper()
-            info_parts.append(f"Lang: {language}")
-
-            if method and method != 'STANDARD':
-                method_display = method.replace('_', ' ').title()
-                info_parts.append(f"Via: {method_display}")
-
-            downloads = result.get('downloads', 0)
-            if downloads > 0:
-                if downloads >= 1000000:
-                    dl_str = f"{downloads / 1000000:.1f}M"
-                elif downloads >= 1000:
-                    dl_str = f"{downloads / 1000:.1f}K"
-                else:
-                    dl_str = str(downloads)
-                info_parts.append(f"↓{dl_str}")
-
-            if result.get('hd'):
-                info_parts.append("HD")
-            if result.get('hearing_impaired'):
-                info_parts.append("HI")
-
-            season_num = result.get('season')
-            episode_num = result.get('episode')
-            if season_num and episode_num:
-                info_parts.append(f"S{season_num:02d}E{episode_num:02d}")
-            elif season_num:
-                info_parts.append(f"S{season_num:02d}")
-
-            release = result.get('release_info', '')
-            if release and len(release) < 20:
-                display_text += f" - {release}"
-
-            if info_parts:
-                display_text += f" ({' | '.join(info_parts)})"
+                self["status"].setText("No subtitles found. Try different search.")
+            return
 
-            list_items.append(display_text)
+        # Prikaži rezultate (isti kod kao prethodno)
+        list_items = [self.formatResultRow(idx, result)
+                      for idx, result in enumerate(self.results_list, 1)]
 
         self["results"].setList(list_items)
 
         # Statistika
-        site_counts = {}
-        method_counts = {}
+        site_counts = Counter()
+        method_counts = Counter()
 
         for result in self.results_list:
-            site = result.get('site', 'Unknown')
-            method = result.get('search_method', 'unknown')
-            site_counts[site] = site_counts.get(site, 0) + 1
-            method_counts[method] = method_counts.get(method, 0) + 1
+            get = result.get
+            site_counts[get('site', 'Unknown')] += 1
+            method_counts[get('search_method', 'unknown')] += 1
 
         total_results = len(self.results_list)
 
         if "IMDB ID" in search_type:
-            method_summary = []
-            for method, count in method_counts.items():
-                if method and method != 'unknown':
-                    method_display = method.replace('_', ' ').title()
-                    method_summary.append(f"{method_display}: {count}")
+            method_summary = [f"{METHOD_NAMES.get(method) or method.replace('_', ' ').title()}: {count}"
+                              for method, count in method_counts.items()
+                              if method and method != 'unknown']
 
             if method_summary:
                 methods_text = ", ".join(method_summary)
@@ -3545,13 +4177,54 @@ class OpenSubtitlesAdvancedSearchScreen(Screen):
                 self["status"].setText(f"ADVANCED IMDB: {total_results} results")
 
         elif "File Name" in search_type:
-            sites_text = ", ".join([f"{s}:{c}" for s, c in site_counts.items()])
+            sites_text = ", ".join(f"{s}:{c}" for s, c in site_counts.items())
             self["status"].setText(f"ADVANCED File: {total_results} results ({sites_text})")
 
         else:
-            sites_text = ", ".join([f"{s}:{c}" for s, c in site_counts.items()])
+            sites_text = ", ".join(f"{s}:{c}" for s, c in site_counts.items())
             self["status"].setText(f"ADVANCED: {total_results} results ({sites_text})")
 
+    def formatResultRow(self, idx, result):
+        """Tekst jednog reda u listi rezultata"""
+        get = result.get
+        title = get('title', 'Unknown')
+        site = get('site', '').upper()
+        method = get('search_method', '').upper()
+
+        method_icon = METHOD_ICONS.get(method, "")
+        site_indicator = f"[{site}] " if site else ""
+        display_title = title if len(title) <= 45 else title[:42] + "..."
+
+        parts = [f"{idx}. {method_icon}{site_indicator}{display_title}"]
+
+        info_parts = [f"Lang: {get('language', 'Unknown').upper()}"]
+
+        if method and method != 'STANDARD':
+            info_parts.append(f"Via: {METHOD_NAMES.get(method) or method.replace('_', ' ').title()}")
+
+        downloads = get('downloads', 0)
+        if downloads > 0:
+            info_parts.append(f"↓{format_downloads(downloads)}")
+
+        if get('hd'):
+            info_parts.append("HD")
+        if get('hearing_impaired'):
+            info_parts.append("HI")
+
+        season_num = get('season')
+        episode_num = get('episode')
+        if season_num and episode_num:
+            info_parts.append(f"S{season_num:02d}E{episode_num:02d}")
+        elif season_num:
+            info_parts.append(f"S{season_num:02d}")
+
+        release = get('release_info', '')
+        if release and len(release) < 20:
+            parts.append(f" - {release}")
+
+        parts.append(f" ({' | '.join(info_parts)})")
+        return ''.join(parts)
+
     def downloadSelected(self):
         """Identican download kao u OpenSubtitlesSearchScreen"""
         selected_idx = self["results"].getSelectedIndex()
@@ -3575,67 +4248,6 @@ class OpenSubtitlesAdvancedSearchScreen(Screen):
         else:
             self.showDownloadError(site, file_id)
     
-    def saveSubtitle(self, content, result):
-        """Identican save kao u OpenSubtitlesSearchScreen"""
-        settings = self.plugin.api.config.read_settings()
-        save_path = settings.get('save_path', '/media/hdd/subtitles/')
-
-        title = result.get('title', 'subtitle').replace(' ', '_')
-        title = re.sub(r'[^\w\-_]', '', title)
-        language = result.get('language', 'unknown').lower()
-        site = result.get('site', 'unknown')
-        timestamp = int(time.time())
-        
-        ext = '.srt'
-        if isinstance(content, bytes):
-            if content.startswith(b'WEBVTT'):
-                ext = '.vtt'
-            elif content.startswith(b'1\r\n0'):
-                ext = '.sub'
-        
-        filename = f"{title}_{site}_{language}_{timestamp}{ext}"
-        full_path = os.path.join(save_path, filename)
-
-        try:
-            if not pathExists(save_path):
-                createDir(save_path)
-
-            if isinstance(content, str):
-                content = content.encode('utf-8')
-
-            with open(full_path, 'wb') as f:
-                f.write(content)
-
-            self["status"].setText(f"Downloaded: {filename}")
-            self.session.open(MessageBox,
-                              f"Subtitle downloaded successfully!\n\nSaved to: {full_path}",
-                              MessageBox.TYPE_INFO,
-                              timeout=5)
-
-        except Exception as e:
-            self["status"].setText(f"Error: {str(e)}")
-            self.session.open(MessageBox,
-                              f"Error saving subtitle: {str(e)}",
-                              MessageBox.TYPE_ERROR)
-    
-    def showDownloadError(self, site, file_id=""):
-        """Identican error kao u OpenSubtitlesSearchScreen"""
-        if site.lower() == 'subdl':
-            error_msg = f"""SubDL download failed!
-
-File ID: {file_id}
-
-Check:
-1. SubDL API key is valid
-2. Language codes are UPPERCASE (EN, SR, HR)
-3. Try different result
-4. Try SMART search instead"""
-        else:
-            error_msg = "Download failed! Check API keys and connection."
-        
-        self["status"].setText("Download failed!")
-        self.session.open(MessageBox, error_msg, MessageBox.TYPE_ERROR)
-    
     def up(self):
         if self["results"].getList():
             self["results"].up()
@@ -3774,6 +4386,8 @@ class OpenSubtitlesSeriesSearchScreen(Screen):
         Screen.__init__(self, session)
         self.session = session
         self.plugin = plugin
+        self.ready_dirs = set()  # Direktorijumi za koje je makedirs već urađen
+        self.searching = False
 
         self["header"] = Label("SERIES SUBTITLES SEARCH v1.4")
         self["series_label"] = Label("Series:")
@@ -3791,10 +4405,7 @@ class OpenSubtitlesSeriesSearchScreen(Screen):
 
         self.current_field = "series"
 
-        self["key_red"] = StaticText("")
-        self["key_green"] = StaticText("")
-        self["key_yellow"] = StaticText("")
-        self["key_blue"] = StaticText("")
+        add_color_keys(self)
 
         self["actions"] = ActionMap(["ColorActions", "SetupActions", "MovieSelectionActions"],
                                     {
@@ -3819,15 +4430,15 @@ class OpenSubtitlesSeriesSearchScreen(Screen):
 
         if not series_text or not series_text.strip():
             self.current_field = "series"
-            self["instructions"].setText("Press YELLOW to enter SERIES name")
+            set_text(self["instructions"], "Press YELLOW to enter SERIES name")
         elif series_text.strip() and (not season_text or not season_text.strip()):
             self.current_field = "season"
-            self["instructions"].setText("Press YELLOW to enter SEASON number")
+            set_text(self["instructions"], "Press YELLOW to enter SEASON number")
         elif series_text.strip() and season_text.strip() and (not episode_text or not episode_text.strip()):
             self.current_field = "episode"
-            self["instructions"].setText("Press YELLOW to enter EPISODE number")
+            set_text(self["instructions"], "Press YELLOW to enter EPISODE number")
         else:
-            self["instructions"].setText("All fields filled. Press GREEN to search!")
+            set_text(self["instructions"], "All fields filled. Press GREEN to search!")
 
     def openKeyboard(self):
         if self.current_field == "series":
@@ -3880,6 +4491,10 @@ class OpenSubtitlesSeriesSearchScreen(Screen):
             self.updateDisplay()
 
     def doSearch(self):
+        if self.searching:
+            self["status"].setText("Search in progress...")
+            return
+
         series_name = self["series_input"].getText()
         if not series_name or not series_name.strip():
             self["status"].setText("ERROR: Please enter series name!")
@@ -3887,25 +4502,18 @@ class OpenSubtitlesSeriesSearchScreen(Screen):
 
         series_name = series_name.strip()
 
-        season_str = self["season_input"].getText()
-        episode_str = self["episode_input"].getText()
+        season_str = (self["season_input"].getText() or "").strip()
+        episode_str = (self["episode_input"].getText() or "").strip()
 
-        season = None
-        episode = None
-
-        if season_str and season_str.strip():
-            try:
-                season = int(season_str.strip())
-            except:
-                self["status"].setText("ERROR: Invalid season number!")
-                return
+        season = parse_number(season_str)
+        if season_str and season is None:
+            self["status"].setText("ERROR: Invalid season number!")
+            return
 
-        if episode_str and episode_str.strip():
-            try:
-                episode = int(episode_str.strip())
-            except:
-                self["status"].setText("ERROR: Invalid episode number!")
-                return
+        episode = parse_number(episode_str)
+        if episode_str and episode is None:
+            self["status"].setText("ERROR: Invalid episode number!")
+            return
 
         search_display = f"'{series_name}'"
         if season is not None:
@@ -3915,67 +4523,68 @@ class OpenSubtitlesSeriesSearchScreen(Screen):
 
         self["status"].setText(f"Searching {search_display}...")
 
-        # Koristimo glavni API za pretragu
-        results = self.plugin.api.search_all(series_name, season=season, episode=episode)
+        # Koristimo glavni API za pretragu - u pozadinskoj niti da GUI ne zablokira
+        self.searching = True
+        defer_while_open(self, self.plugin.api.search_all, series_name,
+                         season=season, episode=episode).addCallbacks(
+            self.searchDone, self.searchFailed)
 
-        self.results_list = results or []
-        list_items = []
+    def searchFailed(self, failure):
+        self.searching = False
+        print(f"[SERIES SEARCH] Error: {failure.getErrorMessage()}")
+        self["status"].setText("Series search failed!")
 
-        if self.results_list:
-            for idx, result in enumerate(self.results_list, 1):
-                title = result.get('title', 'Unknown')
-                site = result.get('site', '').upper()
-                site_indicator = f"[{site}] " if site else ""
+    def searchDone(self, results):
+        self.searching = False
+        self.results_list = results or []
 
-                display_text = f"{idx}. {site_indicator}{title[:45]}"
-                if len(title) > 45:
-                    display_text += "..."
+        # Redovi liste i statistika po sajtu u jednom prolazu
+        site_counts = Counter()
+        list_items = []
+        for idx, result in enumerate(self.results_list, 1):
+            site_counts[result.get('site', 'Unknown')] += 1
+            list_items.append(self.formatResultRow(idx, result))
 
-                info_parts = []
+        self["results"].setList(list_items or ["No results found"])
 
-                language = result.get('language', 'Unknown').upper()
-                info_parts.append(f"Lang: {language}")
+        if self.results_list:
+            site_summary = ", ".join(f"{s}:{c}" for s, c in site_counts.items())
+            self["status"].setText(f"Found {len(self.results_list)} results from {len(site_counts)} services [{site_summary}]")
+        else:
+            self["status"].setText("No results found. Try different search.")
 
-                season_num = result.get('season')
-                episode_num = result.get('episode')
-                if season_num and episode_num:
-                    info_parts.append(f"S{season_num:02d}E{episode_num:02d}")
-                elif season_num:
-                    info_parts.append(f"S{season_num:02d}")
+    def formatResultRow(self, idx, result):
+        """Tekst jednog reda u listi rezultata"""
+        get = result.get
+        title = get('title', 'Unknown')
+        site = get('site', '').upper()
+        site_indicator = f"[{site}] " if site else ""
 
-                downloads = result.get('downloads', 0)
-                if downloads > 0:
-                    try:
-                        downloads_str = f"{downloads:,}".replace(",", ".")
-                        info_parts.append(f"↓{downloads_str}")
-                    except:
-                        info_parts.append(f"↓{downloads}")
+        parts = [f"{idx}. {site_indicator}{title[:45]}"]
+        if len(title) > 45:
+            parts.append("...")
 
-                if result.get('hd'):
-                    info_parts.append("HD")
+        info_parts = [f"Lang: {get('language', 'Unknown').upper()}"]
 
-                if result.get('hearing_impaired'):
-                    info_parts.append("HI")
+        season_num = get('season')
+        episode_num = get('episode')
+        if season_num and episode_num:
+            info_parts.append(f"S{season_num:02d}E{episode_num:02d}")
+        elif season_num:
+            info_parts.append(f"S{season_num:02d}")
 
-                if info_parts:
-                    display_text += f" ({' | '.join(info_parts)})"
+        downloads = get('downloads', 0)
+        if downloads > 0:
+            info_parts.append(f"↓{format_thousands(downloads)}")
 
-                list_items.append(display_text)
-        else:
-            list_items = ["No results found"]
+        if get('hd'):
+            info_parts.append("HD")
 
-        self["results"].setList(list_items)
+        if get('hearing_impaired'):
+            info_parts.append("HI")
 
-        if self.results_list:
-            site_counts = {}
-            for result in self.results_list:
-                site = result.get('site', 'Unknown')
-                site_counts[site] = site_counts.get(site, 0) + 1
-            
-            site_summary = ", ".join([f"{s}:{c}" for s, c in site_counts.items()])
-            self["status"].setText(f"Found {len(self.results_list)} results from {len(site_counts)} services [{site_summary}]")
-        else:
-            self["status"].setText("No results found. Try different search.")
+        parts.append(f" ({' | '.join(info_parts)})")
+        return ''.join(parts)
 
     def downloadSelected(self):
         selected_idx = self["results"].getSelectedIndex()
@@ -4003,12 +4612,12 @@ class OpenSubtitlesSeriesSearchScreen(Screen):
         save_path = settings.get('save_path', '/media/hdd/subtitles/')
 
         title = result.get('title', 'subtitle').replace(' ', '_')
-        title = re.sub(r'[^\w\-_]', '', title)
+        title = title.translate(FILENAME_STRIP_TABLE)
         language = result.get('language', 'unknown').lower()
         site = result.get('site', 'unknown')
         season = result.get('season')
         episode = result.get('episode')
-        timestamp = int(time.time())
+        timestamp = SAVE_BASE_TS + next(SAVE_COUNTER)
 
         if season and episode:
             filename = f"{title}_S{season:02d}E{episode:02d}_{site}_{language}_{timestamp}.srt"
@@ -4017,17 +4626,11 @@ class OpenSubtitlesSeriesSearchScreen(Screen):
         else:
             filename = f"{title}_{site}_{language}_{timestamp}.srt"
 
-        full_path = os.path.join(save_path, filename)
+        full_path = f"{save_path.rstrip('/')}/{filename}"
 
         try:
-            if not pathExists(save_path):
-                createDir(save_path)
-
-            if isinstance(content, str):
-                content = content.encode('utf-8')
-
-            with open(full_path, 'wb') as f:
-                f.write(content)
+            write_subtitle(full_path, content, save_path not in self.ready_dirs)
+            self.ready_dirs.add(save_path)
 
             self["status"].setText(f"Downloaded: {filename}")
             self.session.open(MessageBox,
@@ -4112,7 +4715,9 @@ class TitloviSearchScreen(Screen):
         Screen.__init__(self, session)
         self.session = session
         self.plugin = plugin
+        self.ready_dirs = set()  # Direktorijumi za koje je makedirs već urađen
         self.initial_query = initial_query
+        self.searching = False
 
         self["header"] = Label("TITLOVI.COM - IMDB ID or Movie title")
         self["input_label"] = Label("Search:")
@@ -4148,9 +4753,9 @@ class TitloviSearchScreen(Screen):
         """Ažuriraj status display"""
         search_text = self["input"].getText()
         if not search_text or not search_text.strip():
-            self["status"].setText("Enter")
+            set_text(self["status"], "Enter")
         else:
-            self["status"].setText(f"Ready to search Titlovi.com: {search_text[:30]}...")
+            set_text(self["status"], f"Ready to search Titlovi.com: {search_text[:30]}...")
 
     def openKeyboard(self):
         """Otvori virtuelnu tastaturu"""
@@ -4173,6 +4778,10 @@ class TitloviSearchScreen(Screen):
                 
     def doSearch(self):
         """Izvrši pretragu na Titlovi.com"""
+        if self.searching:
+            self["status"].setText("Search in progress...")
+            return
+
         query = self["input"].getText().strip()
         if not query:
             self["status"].setText("Please enter search term!")
@@ -4180,10 +4789,19 @@ class TitloviSearchScreen(Screen):
 
         self["status"].setText(f"Searching Titlovi.com for: '{query}'...")
 
-        # Pozovi Titlovi.com API
-        results = self.plugin.api.search_titlovi_only(query)
+        # Pozovi Titlovi.com API - u pozadinskoj niti da GUI ne zablokira
+        self.searching = True
+        defer_while_open(self, self.plugin.api.search_titlovi_only, query).addCallbacks(
+            self.searchDone, self.searchFailed, callbackArgs=(query,))
+
+    def searchFailed(self, failure):
+        self.searching = False
+        print(f"[TITLOVI SEARCH] Error: {failure.getErrorMessage()}")
+        self["status"].setText("Titlovi.com search failed!")
 
-        print(f"[TITLOVI SEARCH] Got {len(results)} results")
+    def searchDone(self, results, query):
+        self.searching = False
+        print(f"[TITLOVI SEARCH] Got {len(results or [])} results")
 
         self.results_list = results or []
 
@@ -4194,50 +4812,42 @@ class TitloviSearchScreen(Screen):
             return
 
         # Prikaži rezultate
-        list_items = []
-        for idx, result in enumerate(self.results_list, 1):
-            title = result.get('title', 'Unknown')
-            year = result.get('year', '')
-            language = result.get('language', 'Unknown')
-            downloads = result.get('downloads', 0)
-
-            # NOVO: Formatiraj prikaz SA JEZIKOM
-            display_text = f"{idx}. {title}"
-            if year:
-                display_text += f" ({year})"
+        list_items = [self.formatResultRow(idx, result)
+                      for idx, result in enumerate(self.results_list, 1)]
+        self["results"].setList(list_items)
 
-            # NOVO: Dodaj jezik jasno
-            language_display = self.get_language_display(language)
-            display_text += f" - {language_display}"
+        # Prikaži statistiku
+        total = len(self.results_list)
+        self["status"].setText(f"Titlovi.com: {total} results found")
 
-            # Skrati ako je predugo
-            if len(display_text) > 100:
-                display_text = display_text[:80] + "..."
+    def formatResultRow(self, idx, result):
+        """Tekst jednog reda u listi rezultata (naslov, godina, jezik, release, preuzimanja)"""
+        get = result.get
+        year = get('year', '')
 
-            # Download broj
-            info_parts = []
-            if downloads > 0:
-                if downloads >= 1000:
-                    dl_str = f"↓{downloads / 1000:.1f}K"
-                else:
-                    dl_str = f"↓{downloads}"
-                info_parts.append(dl_str)
+        # Formatiraj prikaz SA JEZIKOM
+        display_text = (f"{idx}. {get('title', 'Unknown')}{f' ({year})' if year else ''}"
+                        f" - {self.get_language_display(get('language', 'Unknown'))}")
 
-            # Dodaj release info ako postoji
-            release = result.get('release_info', '')
-            if release and len(release) < 20:
-                display_text += f" - {release}"
+        # Skrati ako je predugo
+        if len(display_text) > 100:
+            display_text = display_text[:80] + "..."
 
-            if info_parts:
-                display_text += f" ({' | '.join(info_parts)})"
+        parts = [display_text]
 
-            list_items.append(display_text)
+        # Dodaj release info ako postoji
+        release = get('release_info', '')
+        if release and len(release) < 20:
+            parts.append(f" - {release}")
 
-        self["results"].setList(list_items)
+        # Download broj
+        downloads = get('downloads', 0)
+        if downloads >= 1000:
+            parts.append(f" (↓{downloads / 1000:.1f}K)")
+        elif downloads > 0:
+            parts.append(f" (↓{downloads})")
 
-        # Prikaži statistiku
-        total = len(self.results_list)
-        self["status"].setText(f"Titlovi.com: {total} results found")
+        return ''.join(parts)
 
     def downloadSelected(self):
         """Preuzmi selektovani titl - OVO JE METODA KOJA NEDOSTAJE!"""
@@ -4290,12 +4900,13 @@ Try:
 
         # Kreiraj bazni naziv (samo za log)
         title = result.get('title', 'subtitle').replace(' ', '_')
-        title = re.sub(r'[^\w\-_]', '', title)[:40]
-        timestamp = int(time.time())
+        title = title.translate(FILENAME_STRIP_TABLE)[:40]
+        timestamp = SAVE_BASE_TS + next(SAVE_COUNTER)
 
         try:
-            if not pathExists(save_path):
-                createDir(save_path)
+            if save_path not in self.ready_dirs:
+                os.makedirs(save_path, exist_ok=True)
+                self.ready_dirs.add(save_path)
 
             saved_files = []  # Lista sačuvanih fajlova
             file_count = 0
@@ -4315,7 +4926,7 @@ Try:
                             filename = os.path.basename(srt_filename)
 
                             # Očisti samo opasne karaktere
-                            filename = re.sub(r'[\\/*?:"<>|]', '_', filename)
+                            filename = UNSAFE_FILENAME_RE.sub('_', filename)
 
                             full_path = os.path.join(save_path, filename)
 
@@ -4344,13 +4955,11 @@ Try:
             # STARO PONAŠANJE: direktan fajl ili ZIP bez novog formata
             elif isinstance(content, bytes):
                 # Proveri da li je ZIP
-                if content[:2] == b'PK':
+                if content.startswith(ZIP_MAGIC):
                     print(f"[TITLOVI SEARCH] Old format ZIP, extracting manually...")
 
                     try:
-                        from io import BytesIO
-                        from zipfile import ZipFile
-
+                        # BytesIO nad bytes objektom deli bafer - ZIP se čita bez kopije
                         zipfile = ZipFile(BytesIO(content))
 
                         # Pronađi SVE SRT fajlove
@@ -4360,7 +4969,7 @@ Try:
 
                                 # Koristi originalni naziv
                                 safe_filename = os.path.basename(filename)
-                                safe_filename = re.sub(r'[\\/*?:"<>|]', '_', safe_filename)
+                                safe_filename = UNSAFE_FILENAME_RE.sub('_', safe_filename)
 
                                 full_path = os.path.join(save_path, safe_filename)
 
@@ -4404,7 +5013,7 @@ Try:
                         ext = '.srt'
 
                     # Kreiraj naziv baziran na naslovu
-                    safe_title = re.sub(r'[^\w\-_]', '_', title)[:30]
+                    safe_title = FILENAME_STRIP_RE.sub('_', title)[:30]
                     filename = f"{safe_title}_{timestamp}{ext}"
                     full_path = os.path.join(save_path, filename)
 
@@ -4418,7 +5027,7 @@ Try:
                 # String content - kreiraj naziv
                 print(f"[TITLOVI SEARCH] String content")
 
-                safe_title = re.sub(r'[^\w\-_]', '_', title)[:30]
+                safe_title = FILENAME_STRIP_RE.sub('_', title)[:30]
                 filename = f"{safe_title}_{timestamp}.srt"
                 full_path = os.path.join(save_path, filename)
 
@@ -4437,9 +5046,9 @@ Try:
 
                 # Pripremi poruku - prikaži originalne nazive
                 if file_count <= 5:
-                    file_list_text = "\n".join([f"• {f}" for f in saved_files])
+                    file_list_text = "\n".join(f"• {f}" for f in saved_files)
                 else:
-                    file_list_text = "\n".join([f"• {f}" for f in saved_files[:3]])
+                    file_list_text = "\n".join(f"• {f}" for f in saved_files[:3])
                     file_list_text += f"\n• ... and {file_count - 3} more"
 
                 # Dodaj putanju
@@ -4457,10 +5066,11 @@ Try:
 
                 # Takođe prikaži u log-u
                 print(f"[TITLOVI SEARCH] Successfully saved {file_count} files:")
-                for f in saved_files:
-                    file_path = os.path.join(save_path, f)
-                    file_size = os.path.getsize(file_path) if os.path.exists(file_path) else 0
-                    print(f"  - {f} ({file_size} bytes)")
+                if DEBUG:
+                    for f in saved_files:
+                        file_path = os.path.join(save_path, f)
+                        file_size = os.path.getsize(file_path) if os.path.exists(file_path) else 0
+                        print(f"  - {f} ({file_size} bytes)")
 
             elif file_count == 1:
                 self["status"].setText(f"Downloaded: {saved_files[0]}")
@@ -4631,10 +5241,25 @@ class TitloviAdvancedSearchScreen(Screen):
     </screen>
     """
 
+    # Opcije za selektore (isti kao na Titlovi.com)
+    LANGUAGE_OPTIONS = ("Svi jezici", "Srpski", "Hrvatski", "Bosanski", "Slovenački",
+                        "Makedonski", "Bugarski", "Crnogorski", "Engleski")
+    TYPE_OPTIONS = ("TV Serija", "Film", "Svi")
+    SORT_OPTIONS = ("Datum postavljanja", "Naziv", "IMDb ocena", "Broj preuzimanja")
+
+    # Vrednosti URL parametara za izabrane opcije ("Svi jezici" / "Svi" nemaju parametar)
+    LANGUAGE_PARAMS = {
+        "Srpski": 'sr', "Hrvatski": 'hr', "Bosanski": 'bs', "Slovenački": 'sl',
+        "Makedonski": 'mk', "Bugarski": 'bg', "Crnogorski": 'me', "Engleski": 'en'
+    }
+    TYPE_PARAMS = {"TV Serija": 'tv', "Film": 'movie'}
+    SORT_PARAMS = {"Datum postavljanja": '4', "Naziv": '1', "IMDb ocena": '2', "Broj preuzimanja": '3'}
+
     def __init__(self, session, plugin):
         Screen.__init__(self, session)
         self.session = session
         self.plugin = plugin
+        self.ready_dirs = set()  # Direktorijumi za koje je makedirs već urađen
 
         # Naslov
         self["header"] = Label("TITLOVI.COM ADVANCED SEARCH")
@@ -4662,17 +5287,17 @@ class TitloviAdvancedSearchScreen(Screen):
 
         self["results"] = MenuList([])
         self.results_list = []
-
-        # Opcije za selektore (isti kao na Titlovi.com)
-        self.language_options = ["Svi jezici", "Srpski", "Hrvatski", "Bosanski", "Slovenački",
-                                 "Makedonski", "Bugarski", "Crnogorski", "Engleski"]
-        self.type_options = ["TV Serija", "Film", "Svi"]
-        self.sort_options = ["Datum postavljanja", "Naziv", "IMDb ocena", "Broj preuzimanja"]
+        self.searching = False
+        self.video_files_cache = {}  # direktorijum -> lista video fajlova
 
         self.current_language_idx = 0
         self.current_type_idx = 0
         self.current_sort_idx = 0
 
+        # Odloženo osvežavanje labela opcija (držanje levo/desno menja indeks više puta)
+        self.options_timer = eTimer()
+        self.options_timer.callback.append(self.refreshOptions)
+
         # Trenutno selektovano polje za unos
         self.current_field = "title"
 
@@ -4782,6 +5407,10 @@ class TitloviAdvancedSearchScreen(Screen):
         episode = self["episode_input"].getText().strip()
         year = self["year_input"].getText().strip()
 
+        if self.searching:
+            self["status"].setText("Pretraga je u toku...")
+            return
+
         # Proveri da li je nešto uneto
         if not title and not imdb:
             self["status"].setText("Unesite bar NASLOV ili IMDB ID!")
@@ -4811,46 +5440,18 @@ class TitloviAdvancedSearchScreen(Screen):
                 params['y'] = year
 
             # Tip pretrage (film/serija)
-            type_option = self.type_options[self.current_type_idx]
-            if type_option == "TV Serija":
-                params['type'] = 'tv'
-            elif type_option == "Film":
-                params['type'] = 'movie'
+            type_param = self.TYPE_PARAMS.get(self.TYPE_OPTIONS[self.current_type_idx])
+            if type_param:
+                params['type'] = type_param
 
             # Sortiranje
-            sort_option = self.sort_options[self.current_sort_idx]
-            if sort_option == "Datum postavljanja":
-                params['sort'] = '4'  # sort=4 na sajtu
-            elif sort_option == "Naziv":
-                params['sort'] = '1'
-            elif sort_option == "IMDb ocena":
-                params['sort'] = '2'
-            elif sort_option == "Broj preuzimanja":
-                params['sort'] = '3'
+            params['sort'] = self.SORT_PARAMS[self.SORT_OPTIONS[self.current_sort_idx]]
 
             print(f"[TITLOVI ADVANCED] Advanced search params: {params}")
 
             # JEZIČKI PARAMETAR - Bitno za Titlovi.com
             # Na osnovu jezika izabranog u meniju
-            language_option = self.language_options[self.current_language_idx]
-            jezik_param = None
-
-            if language_option == "Srpski":
-                jezik_param = 'sr'
-            elif language_option == "Hrvatski":
-                jezik_param = 'hr'
-            elif language_option == "Bosanski":
-                jezik_param = 'bs'
-            elif language_option == "Slovenački":
-                jezik_param = 'sl'
-            elif language_option == "Makedonski":
-                jezik_param = 'mk'
-            elif language_option == "Bugarski":
-                jezik_param = 'bg'
-            elif language_option == "Crnogorski":
-                jezik_param = 'me'
-            elif language_option == "Engleski":
-                jezik_param = 'en'
+            jezik_param = self.LANGUAGE_PARAMS.get(self.LANGUAGE_OPTIONS[self.current_language_idx])
 
             if jezik_param:
                 params['l'] = jezik_param
@@ -4859,28 +5460,13 @@ class TitloviAdvancedSearchScreen(Screen):
             # MODIFIKUJEMO search metodu da prihvati sve parametre
             search_query = title if title else imdb
 
-            results = self.plugin.api.titlovi_api.advanced_search(
-                query=search_query,
-                params=params
-            )
-
-            if results:
-                print(f"[TITLOVI ADVANCED] Found {len(results)} results")
-                self.processResults(results)
-            else:
-                # Pokušaj standardnom pretragom kao fallback
-                print(f"[TITLOVI ADVANCED] Trying fallback search...")
-                fallback_results = self.plugin.api.titlovi_api.search(
-                    query=search_query,
-                    season=int(season) if season and season.isdigit() else None,
-                    episode=int(episode) if episode and episode.isdigit() else None
-                )
-
-                if fallback_results:
-                    self.processResults(fallback_results)
-                else:
-                    self["results"].setList(["Nema rezultata za vašu pretragu"])
-                    self["status"].setText("Nema rezultata - probajte druge parametre")
+            # Pretraga ide u pozadinskoj niti da GUI ne zablokira
+            self.searching = True
+            defer_while_open(
+                self, self.runAdvancedSearch, search_query, params,
+                int(season) if season and season.isdigit() else None,
+                int(episode) if episode and episode.isdigit() else None
+            ).addCallbacks(self.searchDone, self.searchFailed)
 
         except Exception as e:
             print(f"[TITLOVI ADVANCED] Error: {e}")
@@ -4889,6 +5475,31 @@ class TitloviAdvancedSearchScreen(Screen):
             self["status"].setText(f"Greška: {str(e)[:50]}")
             self["results"].setList(["Došlo je do greške prilikom pretrage"])
 
+    def runAdvancedSearch(self, search_query, params, season, episode):
+        """Napredna pretraga, a standardna (fallback) samo ako napredna ne nađe ništa
+        - izvršava se u pozadinskoj niti"""
+        results = self.plugin.api.search_titlovi_advanced(search_query, params)
+        if results:
+            print(f"[TITLOVI ADVANCED] Found {len(results)} results")
+            return results
+
+        print(f"[TITLOVI ADVANCED] Using fallback search...")
+        return self.plugin.api.search_titlovi_only(search_query, season=season, episode=episode)
+
+    def searchFailed(self, failure):
+        self.searching = False
+        print(f"[TITLOVI ADVANCED] Error: {failure.getErrorMessage()}")
+        self["status"].setText(f"Greška: {failure.getErrorMessage()[:50]}")
+        self["results"].setList(["Došlo je do greške prilikom pretrage"])
+
+    def searchDone(self, results):
+        self.searching = False
+        if results:
+            self.processResults(results)
+        else:
+            self["results"].setList(["Nema rezultata za vašu pretragu"])
+            self["status"].setText("Nema rezultata - probajte druge parametre")
+
     def processResults(self, results):
         """Procesiraj i prikaži rezultate"""
         self.results_list = results
@@ -4898,79 +5509,74 @@ class TitloviAdvancedSearchScreen(Screen):
             self["status"].setText("Nema pronađenih titlova")
             return
 
-        list_items = []
-        for idx, result in enumerate(self.results_list, 1):
-            title = result.get('title', 'Bez naslova')
-            year = result.get('year', '')
-            language = result.get('language', '')
-            downloads = result.get('downloads', 0)
-
-            # Proveri da li je serija
-            is_series = result.get('is_series', False)
-            season = result.get('season')
-            episode = result.get('episode')
-
-            # Formatiraj prikaz
-            display_text = f"{idx}. {title}"
-
-            # Dodaj godinu ako postoji
-            if year:
-                display_text += f" ({year})"
-
-            # Dodaj informacije o seriji
-            if is_series and season and episode:
-                display_text += f" [S{season:02d}E{episode:02d}]"
-            elif is_series and season:
-                display_text += f" [S{season:02d}]"
-
-            # Skrati ako je predugo
-            if len(display_text) > 100:
-                display_text = display_text[:80] + "..."
-
-            # Dodaj detalje u zagradama
-            info_parts = []
-
-            # Jezik
-            if language:
-                lang_code = self.get_lang_code(language)
-                info_parts.append(lang_code)
-
-            # Preuzimanja
-            if downloads > 0:
-                if downloads >= 1000:
-                    dl_str = f"↓{downloads / 1000:.1f}K"
-                else:
-                    dl_str = f"↓{downloads}"
-                info_parts.append(dl_str)
-
-            # IMDB ocena ako postoji
-            rating = result.get('imdb_rating')
-            if rating:
-                info_parts.append(f"⭐{rating}")
-
-            if info_parts:
-                display_text += f" ({' | '.join(info_parts)})"
-
-            list_items.append(display_text)
+        list_items = [self.formatResultRow(idx, result)
+                      for idx, result in enumerate(self.results_list, 1)]
 
         self["results"].setList(list_items)
         self["status"].setText(f"Pronađeno {len(self.results_list)} titlova")
 
-    def get_lang_code(self, language):
-        """Vrati skraćenicu za jezik"""
-        lang_map = {
-            'srpski': 'SRP', 'српски': 'SRP',
-            'hrvatski': 'HRV', 'croatian': 'HRV',
-            'bosanski': 'BOS', 'bosnian': 'BOS',
-            'slovenački': 'SLV', 'slovenian': 'SLV',
-            'makedonski': 'MKD', 'macedonian': 'MKD',
-            'bugarski': 'BUL', 'bulgarian': 'BUL',
-            'crnogorski': 'MNE', 'montenegrin': 'MNE',
-            'engleski': 'ENG', 'english': 'ENG'
-        }
-
+    def formatResultRow(self, idx, result):
+        """Tekst jednog reda u listi rezultata"""
+        get = result.get
+        year = get('year', '')
+        season = get('season')
+        episode = get('episode')
+
+        # Informacije o seriji
+        series_part = ""
+        if get('is_series', False) and season:
+            series_part = series_label(season, episode)
+
+        display_text = f"{idx}. {get('title', 'Bez naslova')}{f' ({year})' if year else ''}{series_part}"
+
+        # Skrati ako je predugo
+        if len(display_text) > 100:
+            display_text = display_text[:80] + "..."
+
+        # Detalji u zagradama: jezik, preuzimanja, IMDB ocena
+        info_parts = []
+
+        language = get('language', '')
+        if language:
+            info_parts.append(self.get_lang_code(language))
+
+        downloads = get('downloads', 0)
+        if downloads >= 1000:
+            info_parts.append(f"↓{downloads / 1000:.1f}K")
+        elif downloads > 0:
+            info_parts.append(f"↓{downloads}")
+
+        rating = get('imdb_rating')
+        if rating:
+            info_parts.append(f"⭐{rating}")
+
+        if info_parts:
+            return f"{display_text} ({' | '.join(info_parts)})"
+        return display_text
+
+    # Delovi naziva jezika -> skraćenica (redosled je bitan, prvo poklapanje pobeđuje)
+    LANG_CODES = (
+        ('srpski', 'SRP'), ('српски', 'SRP'),
+        ('hrvatski', 'HRV'), ('croatian', 'HRV'),
+        ('bosanski', 'BOS'), ('bosnian', 'BOS'),
+        ('slovenački', 'SLV'), ('slovenian', 'SLV'),
+        ('makedonski', 'MKD'), ('macedonian', 'MKD'),
+        ('bugarski', 'BUL'), ('bulgarian', 'BUL'),
+        ('crnogorski', 'MNE'), ('montenegrin', 'MNE'),
+        ('engleski', 'ENG'), ('english', 'ENG')
+    )
+    LANG_CODE_EXACT = dict(LANG_CODES)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def get_lang_code(language):
+        """Vrati skraćenicu za jezik (mali skup naziva - rezultat se pamti)"""
         lang_lower = language.lower()
-        for key, code in lang_map.items():
+        # Najčešće je naziv jezika tačno jedan od ključeva
+        code = TitloviAdvancedSearchScreen.LANG_CODE_EXACT.get(lang_lower)
+        if code:
+            return code
+        for key, code in TitloviAdvancedSearchScreen.LANG_CODES:
             if key in lang_lower:
                 return code
 
@@ -5032,23 +5638,23 @@ Pokušajte:
 
         # Kreiraj ime fajla
         title = result.get('title', 'titl').replace(' ', '_')
-        title = re.sub(r'[^\w\-_]', '', title)
+        title = title.translate(FILENAME_STRIP_TABLE)
         language = result.get('language_code', 'srp')
-        timestamp = int(time.time())
+        timestamp = SAVE_BASE_TS + next(SAVE_COUNTER)
 
         # Dodaj sezonu/epizodu za serije
         season = result.get('season')
         episode = result.get('episode')
 
-        # Odredi ekstenziju
+        # Odredi ekstenziju - find() sa granicom gleda zaglavlje bez kopiranja (slice)
         if isinstance(content, bytes):
-            if content.startswith(b'PK'):
+            if content.startswith(ZIP_MAGIC):
                 ext = '.zip'
-            elif b'WEBVTT' in content[:100]:
+            elif content.find(b'WEBVTT', 0, 100) != -1:
                 ext = '.vtt'
-            elif b'[Script Info]' in content[:100]:
+            elif content.find(b'[Script Info]', 0, 100) != -1:
                 ext = '.ass'
-            elif b'{' in content[:50] and b'}' in content[:50]:
+            elif content.find(b'{', 0, 50) != -1 and content.find(b'}', 0, 50) != -1:
                 ext = '.sub'
             else:
                 ext = '.srt'
@@ -5063,17 +5669,11 @@ Pokušajte:
         else:
             filename = f"Titlovi_{title}_{language}_{timestamp}{ext}"
 
-        full_path = os.path.join(save_path, filename)
+        full_path = f"{save_path.rstrip('/')}/{filename}"
 
         try:
-            if not pathExists(save_path):
-                createDir(save_path)
-
-            if isinstance(content, str):
-                content = content.encode('utf-8')
-
-            with open(full_path, 'wb') as f:
-                f.write(content)
+            write_subtitle(full_path, content, save_path not in self.ready_dirs)
+            self.ready_dirs.add(save_path)
 
             self["status"].setText(f"Sačuvano: {filename}")
 
@@ -5092,34 +5692,42 @@ Pokušajte:
                               f"Greška pri čuvanju titla: {str(e)}",
                               MessageBox.TYPE_ERROR)
 
+    def getVideoFiles(self, sub_dir):
+        """Lista video fajlova u direktorijumu, keširana za trajanje ekrana"""
+        videos = self.video_files_cache.get(sub_dir)
+        if videos is None:
+            with os.scandir(sub_dir) as entries:
+                videos = [e.name for e in entries if e.name.lower().endswith(VIDEO_EXTENSIONS)]
+            self.video_files_cache[sub_dir] = videos
+        return videos
+
     def autoMapSubtitle(self, subtitle_path, base_name):
         """Pokušaj automatski mapirati titl na video fajl"""
         try:
-            video_extensions = ['.mkv', '.mp4', '.avi', '.ts', '.mov', '.m2ts']
             sub_dir = os.path.dirname(subtitle_path)
 
             if os.path.exists(sub_dir):
-                for file in os.listdir(sub_dir):
-                    if any(file.lower().endswith(ext) for ext in video_extensions):
-                        video_name = os.path.splitext(file)[0]
-
-                        # Proveri sličnost imena
-                        if (base_name.lower() in video_name.lower() or
-                                video_name.lower() in base_name.lower() or
-                                self.is_similar(base_name, video_name)):
-
-                            # Koristi jezik iz konfiguracije
-                            settings = self.plugin.api.config.read_settings()
-                            languages = settings.get('languages', ['srp'])
-                            lang_code = languages[0] if languages else 'srp'
-
-                            new_name = f"{video_name}.{lang_code}.srt"
-                            new_path = os.path.join(sub_dir, new_name)
-
-                            if not os.path.exists(new_path):
-                                os.rename(subtitle_path, new_path)
-                                print(f"[TITLOVI ADVANCED] Auto-mapped to: {new_name}")
-                                return True
+                base_lower = base_name.lower()
+                for file in self.getVideoFiles(sub_dir):
+                    video_name = os.path.splitext(file)[0]
+                    video_lower = video_name.lower()
+
+                    # Proveri sličnost imena
+                    if (base_lower in video_lower or
+                            video_lower in base_lower or
+                            self.is_similar(base_name, video_name)):
+
+                        # Koristi jezik iz konfiguracije
+                        settings = self.plugin.api.config.read_settings()
+                        languages = settings.get('languages', ['srp'])
+                        lang_code = languages[0] if languages else 'srp'
+
+                        new_name = f"{video_name}.{lang_code}.srt"
+                        new_path = os.path.join(sub_dir, new_name)
+
+                        if rename_if_free(subtitle_path, new_path):
+                            print(f"[TITLOVI ADVANCED] Auto-mapped to: {new_name}")
+                            return True
             return False
         except Exception as e:
             print(f"[TITLOVI ADVANCED] Auto-map error: {e}")
@@ -5127,12 +5735,15 @@ Pokušajte:
 
     def is_similar(self, str1, str2):
         """Proveri da li su stringovi slični"""
-        import difflib
-        str1_clean = re.sub(r'[^\w]', '', str1.lower())
-        str2_clean = re.sub(r'[^\w]', '', str2.lower())
+        str1_clean = NON_WORD_RE.sub('', str1.lower())
+        str2_clean = NON_WORD_RE.sub('', str2.lower())
+
+        if fuzz_ratio is not None:
+            return fuzz_ratio(str1_clean, str2_clean) > 70
 
-        similarity = difflib.SequenceMatcher(None, str1_clean, str2_clean).ratio()
-        return similarity > 0.7
+        # Jeftine gornje granice prvo - pun ratio() samo ako one prođu prag
+        matcher = difflib.SequenceMatcher(None, str1_clean, str2_clean)
+        return matcher.real_quick_ratio() > 0.7 and matcher.quick_ratio() > 0.7 and matcher.ratio() > 0.7
 
     def up(self):
         """Gore strelica - navigacija kroz polja"""
@@ -5175,16 +5786,14 @@ Pokušajte:
         else:
             # Menjanje jezika, tipa ili sortiranja
             if self.current_field == "language":
-                self.current_language_idx = (self.current_language_idx - 1) % len(self.language_options)
-                self["language"].setText(self.language_options[self.current_language_idx])
+                self.current_language_idx = (self.current_language_idx - 1) % len(self.LANGUAGE_OPTIONS)
             elif self.current_field == "type":
-                self.current_type_idx = (self.current_type_idx - 1) % len(self.type_options)
-                self["type"].setText(self.type_options[self.current_type_idx])
+                self.current_type_idx = (self.current_type_idx - 1) % len(self.TYPE_OPTIONS)
             elif self.current_field == "sort":
-                self.current_sort_idx = (self.current_sort_idx - 1) % len(self.sort_options)
-                self["sort"].setText(self.sort_options[self.current_sort_idx])
+                self.current_sort_idx = (self.current_sort_idx - 1) % len(self.SORT_OPTIONS)
 
-            self.updateDisplay()
+            # Labele se osvežavaju jednom kad se držanje tastera smiri
+            self.options_timer.start(50, True)
 
     def right(self):
         """Desno strelica - menjanje opcija ili page down"""
@@ -5193,16 +5802,21 @@ Pokušajte:
         else:
             # Menjanje jezika, tipa ili sortiranja
             if self.current_field == "language":
-                self.current_language_idx = (self.current_language_idx + 1) % len(self.language_options)
-                self["language"].setText(self.language_options[self.current_language_idx])
+                self.current_language_idx = (self.current_language_idx + 1) % len(self.LANGUAGE_OPTIONS)
             elif self.current_field == "type":
-                self.current_type_idx = (self.current_type_idx + 1) % len(self.type_options)
-                self["type"].setText(self.type_options[self.current_type_idx])
+                self.current_type_idx = (self.current_type_idx + 1) % len(self.TYPE_OPTIONS)
             elif self.current_field == "sort":
-                self.current_sort_idx = (self.current_sort_idx + 1) % len(self.sort_options)
-                self["sort"].setText(self.sort_options[self.current_sort_idx])
+                self.current_sort_idx = (self.current_sort_idx + 1) % len(self.SORT_OPTIONS)
 
-            self.updateDisplay()
+            # Labele se osvežavaju jednom kad se držanje tastera smiri
+            self.options_timer.start(50, True)
+
+    def refreshOptions(self):
+        """Prikaži trenutno izabrani jezik, tip i sortiranje"""
+        set_text(self["language"], self.LANGUAGE_OPTIONS[self.current_language_idx])
+        set_text(self["type"], self.TYPE_OPTIONS[self.current_type_idx])
+        set_text(self["sort"], self.SORT_OPTIONS[self.current_sort_idx])
+        self.updateDisplay()
 
     def highlightCurrentField(self):
         """Istakni trenutno selektovano polje (može se implementirati promenom boje)"""
@@ -5272,6 +5886,17 @@ class SubtitleFileExplorer(Screen):
     </screen>
     """
 
+    # Opis tipa fajla prema ekstenziji
+    FILE_TYPES = {
+        '.srt': 'SubRip Subtitle',
+        '.sub': 'MicroDVD Subtitle',
+        '.ass': 'ASS/SSA Subtitle',
+        '.ssa': 'SSA Subtitle',
+        '.vtt': 'WebVTT Subtitle',
+        '.txt': 'Text File',
+        '.zip': 'ZIP Archive'
+    }
+
     def __init__(self, session, plugin):
         Screen.__init__(self, session)
         self.session = session
@@ -5322,33 +5947,23 @@ class SubtitleFileExplorer(Screen):
         self["status"].setText("Loading...")
 
         try:
-            import os
-            from datetime import datetime
-
-            # Pronađi sve subtitle fajlove
-            subtitle_extensions = ['.srt', '.sub', '.ass', '.ssa', '.vtt', '.txt']
-
             # Resetuj listu — bitno za reset selekcije
             self.file_list = []
 
-            for filename in sorted(os.listdir(save_path), key=lambda x: os.path.getmtime(os.path.join(save_path, x)),
-                                   reverse=True):
-                full_path = os.path.join(save_path, filename)
+            # Jedan scandir prolaz: ekstenzija se proverava pre bilo kakvog stat poziva,
+            # a stat se radi jednom po titlu (veličina i vreme iz istog rezultata)
+            subtitles = []
+            with os.scandir(save_path) as entries:
+                for entry in entries:
+                    if entry.name.lower().endswith(SUBTITLE_EXTENSIONS) and entry.is_file():
+                        subtitles.append((entry.stat(), entry))
 
-                # Proveri da li je fajl (ne folder) i da li je subtitle
-                if os.path.isfile(full_path):
-                    if any(filename.lower().endswith(ext) for ext in subtitle_extensions):
-                        # Dobij informacije o fajlu
-                        file_size = os.path.getsize(full_path)
-                        mod_time = os.path.getmtime(full_path)
-                        mod_date = datetime.fromtimestamp(mod_time).strftime('%d.%m.%Y %H:%M')
-
-                        self.file_list.append({
-                            'path': full_path,
-                            'name': filename,
-                            'size': file_size,
-                            'date': mod_date
-                        })
+            subtitles.sort(key=lambda item: item[0].st_mtime, reverse=True)
+
+            for stat, entry in subtitles:
+                lt = time.localtime(stat.st_mtime)
+                mod_date = f"{lt.tm_mday:02d}.{lt.tm_mon:02d}.{lt.tm_year} {lt.tm_hour:02d}:{lt.tm_min:02d}"
+                self.file_list.append(SubtitleFile(entry.path, entry.name, stat.st_size, mod_date))
 
             # Uvek osvežavamo prikaz preko jedinstvene funkcije
             self.updateFileListDisplay()
@@ -5373,7 +5988,7 @@ class SubtitleFileExplorer(Screen):
             return
 
         file_info = self.file_list[selected_idx]
-        filename = file_info['name']
+        filename = file_info.name
 
         # Prikaži opcije za fajl
         options = [
@@ -5425,7 +6040,7 @@ class SubtitleFileExplorer(Screen):
             return
 
         if self.multi_select_mode:
-            file_path = self.file_list[selected_idx]['path']
+            file_path = self.file_list[selected_idx].path
 
             if file_path in self.selected_files:
                 self.selected_files.remove(file_path)
@@ -5443,33 +6058,22 @@ class SubtitleFileExplorer(Screen):
 
     def updateFileListDisplay(self):
         """Ažuriraj prikaz fajlova sa selektovanim oznakama"""
-        if not self.file_list:
-            return
-
-        list_items = []
-
-        for idx, file_info in enumerate(self.file_list):
-            filename = file_info['name']
-            display_name = filename
-            if len(filename) > 80:
-                name, ext = os.path.splitext(filename)
-                display_name = name[:37] + "..." + ext
-
-            # Dodaj oznaku za selektovane fajlove
-            prefix = ""
-            if self.multi_select_mode:
-                if file_info['path'] in self.selected_files:
-                    prefix = "✓ "  # Checkmark za selektovano
-                else:
-                    prefix = "  "  # Prazno mesto
+        list_items = [self.formatFileRow(file_info) for file_info in self.file_list]
+        self["files"].setList(list_items)
 
-            # Formatiraj prikaz
-            display_text = f"{prefix}{display_name}"
-            display_text += f" ({self.format_size(file_info['size'])}, {file_info['date']})"
+    def formatFileRow(self, file_info):
+        """Tekst jednog reda u listi fajlova (oznaka selekcije, naziv, veličina, datum)"""
+        display_name = file_info.name
+        if len(display_name) > 80:
+            name, ext = os.path.splitext(display_name)
+            display_name = name[:37] + "..." + ext
 
-            list_items.append(display_text)
+        # Oznaka za selektovane fajlove
+        prefix = ""
+        if self.multi_select_mode:
+            prefix = "✓ " if file_info.path in self.selected_files else "  "
 
-        self["files"].setList(list_items)
+        return f"{prefix}{display_name} ({self.format_size(file_info.size)}, {file_info.date})"
 
     def confirmMultiDelete(self, confirmed):
         """Potvrdi brisanje više fajlova"""
@@ -5488,7 +6092,7 @@ class SubtitleFileExplorer(Screen):
                     deleted_count += 1
 
                     # Ukloni iz file_list
-                    self.file_list = [f for f in self.file_list if f['path'] != file_path]
+                    self.file_list = [f for f in self.file_list if f.path != file_path]
             except Exception as e:
                 errors.append(f"Error deleting {os.path.basename(file_path)}: {str(e)[:30]}")
 
@@ -5542,14 +6146,14 @@ class SubtitleFileExplorer(Screen):
                 return
 
             file_info = self.file_list[selected_idx]
-            filename = file_info['name']
-            filepath = file_info['path']
+            filename = file_info.name
+            filepath = file_info.path
 
             # Potvrda brisanja
             self.session.openWithCallback(
                 lambda confirm: self.confirmDelete(confirm, filepath, filename, selected_idx),
                 MessageBox,
-                f"Delete file '{filename}'?\n\nSize: {self.format_size(file_info['size'])}\nDate: {file_info['date']}",
+                f"Delete file '{filename}'?\n\nSize: {self.format_size(file_info.size)}\nDate: {file_info.date}",
                 MessageBox.TYPE_YESNO
             )
 
@@ -5596,7 +6200,7 @@ class SubtitleFileExplorer(Screen):
             return
 
         file_info = self.file_list[selected_idx]
-        old_name = file_info['name']
+        old_name = file_info.name
 
         # Otvori virtualnu tastaturu za novi naziv
         self.session.openWithCallback(
@@ -5613,9 +6217,9 @@ class SubtitleFileExplorer(Screen):
 
         import os
 
-        old_path = file_info['path']
+        old_path = file_info.path
         old_dir = os.path.dirname(old_path)
-        old_ext = os.path.splitext(file_info['name'])[1]
+        old_ext = os.path.splitext(file_info.name)[1]
 
         # Dodaj ekstenziju ako je korisnik izostavio
         if not new_name.lower().endswith(old_ext.lower()):
@@ -5623,17 +6227,15 @@ class SubtitleFileExplorer(Screen):
 
         new_path = os.path.join(old_dir, new_name)
 
-        # Proveri da li novi fajl već postoji
-        if os.path.exists(new_path):
-            self.session.open(
-                MessageBox,
-                f"File '{new_name}' already exists!",
-                MessageBox.TYPE_ERROR
-            )
-            return
-
         try:
-            os.rename(old_path, new_path)
+            # Provera postojanja i preimenovanje bez trke između njih
+            if not rename_if_free(old_path, new_path):
+                self.session.open(
+                    MessageBox,
+                    f"File '{new_name}' already exists!",
+                    MessageBox.TYPE_ERROR
+                )
+                return
 
             # Ažuriraj listu
             self.refreshFiles()
@@ -5641,7 +6243,7 @@ class SubtitleFileExplorer(Screen):
             self["status"].setText(f"Renamed to: {new_name}")
             self.session.open(
                 MessageBox,
-                f"File renamed successfully!\n\n{file_info['name']} → {new_name}",
+                f"File renamed successfully!\n\n{file_info.name} → {new_name}",
                 MessageBox.TYPE_INFO,
                 timeout=3
             )
@@ -5666,25 +6268,26 @@ class SubtitleFileExplorer(Screen):
         file_info = self.file_list[selected_idx]
 
         # Pročitaj prvih nekoliko linija fajla
-        preview_lines = []
         try:
-            with open(file_info['path'], 'r', encoding='utf-8', errors='ignore') as f:
-                for i in range(10):  # Prvih 10 linija
-                    line = f.readline()
-                    if not line:
-                        break
-                    preview_lines.append(line.strip()[:80])  # Skrati duge linije
+            # Jedan read() od 4 KB je dovoljan za prvih 10 linija
+            fd = os.open(file_info.path, os.O_RDONLY)
+            try:
+                head = os.read(fd, 4096)
+            finally:
+                os.close(fd)
+            lines = head.decode('utf-8', 'ignore').splitlines()[:10]  # Prvih 10 linija
+            preview_lines = [line.strip()[:80] for line in lines]  # Skrati duge linije
         except:
             preview_lines = ["Could not read file content"]
 
         # Kreiraj info tekst
         info_text = f"""FILE INFORMATION:
 
-Name: {file_info['name']}
-Path: {file_info['path']}
-Size: {self.format_size(file_info['size'])}
-Date: {file_info['date']}
-Type: {self.get_file_type(file_info['name'])}
+Name: {file_info.name}
+Path: {file_info.path}
+Size: {self.format_size(file_info.size)}
+Date: {file_info.date}
+Type: {self.get_file_type(file_info.name)}
 
 PREVIEW:
 """
@@ -5715,20 +6318,8 @@ PREVIEW:
 
     def get_file_type(self, filename):
         """Odredi tip fajla"""
-        import os
         ext = os.path.splitext(filename)[1].lower()
-
-        ext_types = {
-            '.srt': 'SubRip Subtitle',
-            '.sub': 'MicroDVD Subtitle',
-            '.ass': 'ASS/SSA Subtitle',
-            '.ssa': 'SSA Subtitle',
-            '.vtt': 'WebVTT Subtitle',
-            '.txt': 'Text File',
-            '.zip': 'ZIP Archive'
-        }
-
-        return ext_types.get(ext, 'Unknown')
+        return self.FILE_TYPES.get(ext, 'Unknown')
 
     def refreshFiles(self):
         """Osveži listu fajlova"""
@@ -5736,19 +6327,19 @@ PREVIEW:
         self.loadFiles()
 
     def up(self):
-        if self["files"].getList():
+        if self.file_list:
             self["files"].up()
 
     def down(self):
-        if self["files"].getList():
+        if self.file_list:
             self["files"].down()
 
     def left(self):
-        if self["files"].getList():
+        if self.file_list:
             self["files"].pageUp()
 
     def right(self):
-        if self["files"].getList():
+        if self.file_list:
             self["files"].pageDown()
 
 class OpenSubtitlesMainScreen(Screen):
@@ -5768,64 +6359,70 @@ class OpenSubtitlesMainScreen(Screen):
         <eLabel text="Select" position="940,e-80" size="250,60" font="Regular;30" foregroundColor="#ffffff" backgroundColor="#18188b" halign="center" valign="center" zPosition="1" />
     </screen>
     """
+    # Stavke menija (naziv, akcija) - iste za svaki ekran, ne menjaju se
+    MENU_ITEMS = (
+        ("Standard Search (Film Name)", "search_standard"),
+        ("Smart Search (All methods)", "search_smart"),
+        ("Advanced Search (SubDL)", "search_advanced"),
+        ("Titlovi.com Basic", "search_titlovi"),
+        ("Titlovi.com Advanced", "search_titlovi_advanced"),
+        ("Search Series", "search_series"),
+        ("File Explorer", "file_explorer"),
+        ("Configuration", "config"),
+        ("API Keys Setup", "api_keys"),
+        ("Clear Debug Files", "clear_debug"),  # NOVO
+        ("About v1.4", "about"),
+        ("Exit", "exit")
+    )
+
+    # Ikonice stavki menija - prvo pogađanje važi, zato Titlovi.com ide pre "Advanced"
+    MENU_ICONS = (
+        ("Titlovi.com", "🇷🇸 "),  # Balkan ikonica
+        ("Standard", "📝 "),
+        ("Smart", "🚀 "),
+        ("Advanced", "🔍 "),
+        ("Series", "📺 "),
+        ("File Explorer", "📁 "),
+        ("Configuration", "⚙️ "),
+        ("API", "🔑 "),
+        ("Clear Debug", "🗑️ "),
+        ("About", "ℹ️ "),
+        ("Exit", "🚪 "),
+    )
+
+    # Akcija iz menija -> ekran koji se otvara sa (session, plugin)
+    SCREEN_ACTIONS = {
+        "search_standard": OpenSubtitlesSearchScreen,
+        "search_smart": OpenSubtitlesSmartSearchScreen,
+        "search_advanced": OpenSubtitlesAdvancedSearchScreen,
+        "search_titlovi": TitloviSearchScreen,
+        "search_titlovi_advanced": TitloviAdvancedSearchScreen,
+        "search_series": OpenSubtitlesSeriesSearchScreen,
+        "file_explorer": SubtitleFileExplorer,
+        "config": OpenSubtitlesConfigScreen,
+        "api_keys": OpenSubtitlesApiKeysScreen,
+    }
+
+    # Akcije koje ne otvaraju ekran -> metoda ovog ekrana
+    METHOD_ACTIONS = {
+        "clear_debug": "clearDebugFiles",
+        "about": "showAbout",
+        "exit": "close",
+    }
+
     def __init__(self, session, plugin):
         Screen.__init__(self, session)
         self.session = session
         self.plugin = plugin
 
-        # AŽURIRAJ OVAJ LIST items ↓
-        self.menu_items = [
-            ("Standard Search (Film Name)", "search_standard"),
-            ("Smart Search (All methods)", "search_smart"),
-            ("Advanced Search (SubDL)", "search_advanced"),
-            ("Titlovi.com Basic", "search_titlovi"),
-            ("Titlovi.com Advanced", "search_titlovi_advanced"),
-            ("Search Series", "search_series"),
-            ("File Explorer", "file_explorer"),
-            ("Configuration", "config"),
-            ("API Keys Setup", "api_keys"),
-            ("Clear Debug Files", "clear_debug"),  # NOVO
-            ("About v1.4", "about"),
-            ("Exit", "exit")
-        ]
         self["menu"] = MenuList([])
         self["background"] = Pixmap()
 
-        list_items = []
-        for idx, item in enumerate(self.menu_items):
-            # DODAJ OVU IKONICU ZA TITLOVI.COM ↓
-            icon = ""
-            if "Standard" in item[0]:
-                icon = "📝 "
-            elif "Smart" in item[0]:
-                icon = "🚀 "
-            elif "Advanced" in item[0]:
-                icon = "🔍 "
-            elif "Titlovi.com" in item[0]:  # DODATO
-                icon = "🇷🇸 "  # Balkan ikonica
-            elif "Series" in item[0]:
-                icon = "📺 "
-            elif "File Explorer" in item[0]:
-                icon = "📁 "
-            elif "Configuration" in item[0]:
-                icon = "⚙️ "
-            elif "API" in item[0]:
-                icon = "🔑 "
-            elif "About" in item[0]:
-                icon = "ℹ️ "
-            elif "Exit" in item[0]:
-                icon = "🚪 "
-
-
-            list_items.append((f"{idx+1}. {icon}{item[0]}", item[1]))
-
-        self["menu"].list = list_items
-        self["menu"].setList(list_items)
-        
-        self["key_red"] = StaticText("Exit")
-        self["key_green"] = StaticText("Help")
-        self["key_yellow"] = StaticText("Refresh")
-        self["key_blue"] = StaticText("Select")
+        # Lista menija je statična - pravi se jednom, tek kad se ekran iscrta, i koristi i za Refresh
+        self.menu_list = []
+        self.onLayoutFinish.append(self.populateMenu)
+        
+        add_color_keys(self, "Exit", "Help", "Refresh", "Select")
         
         self["title"] = Label("Ciefp Subtitles v1.4")
         
@@ -5892,61 +6489,30 @@ class OpenSubtitlesMainScreen(Screen):
 
     def keyGreen(self):
         """Zeleno dugme - Help za sve tri pretrage"""
-        
-        help_text = f"""Ciefp Subtitles v1.4
-1.STANDARD SEARCH:
-   • Uses Film Name only
-
-2.SMART SEARCH (NEW):
-   • Tries ALL methods in order:
-     1. IMDB ID (best) - tt1375666
-     2. File Name (good) - Movie.Name.2023
-     3. Film Name (ok)
-
-3.ADVANCED SEARCH:
-   • Manual choice: IMDB/File/Film
-   • Use the up and down arrows to change
+        self.session.open(MessageBox, HELP_TEXT, MessageBox.TYPE_INFO)
+    
+    @classmethod
+    @functools.lru_cache(maxsize=1)
+    def buildMenuList(cls):
+        """Stavke menija sa rednim brojem i ikonicom - pravi se jednom za sva otvaranja ekrana"""
+        list_items = []
+        for idx, (label, action) in enumerate(cls.MENU_ITEMS, 1):
+            icon = next((icon for key, icon in cls.MENU_ICONS if key in label), "")
+            list_items.append((f"{idx}. {icon}{label}", action))
+        return list_items
 
-4. TITLOVI.COM SEARCH: (NEW - COMPLETELY SEPARATE!)
-   • Balkan languages ONLY (srp/hrv/bos/slv/mkd)
-   • NO API key required
-   • HTML scraping (no API)
-   • Perfect for Balkan users
+    def populateMenu(self):
+        self.menu_list = self.buildMenuList()
+        self["menu"].setList(self.menu_list)
 
-..:: CiefpSettings ::.."""
-        self.session.open(MessageBox, help_text, MessageBox.TYPE_INFO)
-    
     def keyYellow(self):
         """Žuto dugme - Refresh"""
-        list_items = []
-        for idx, item in enumerate(self.menu_items):
-            # DODAJ OVU IKONICU ZA TITLOVI.COM ↓
-            icon = ""
-            if "Standard" in item[0]:
-                icon = "📝 "
-            elif "Smart" in item[0]:
-                icon = "🚀 "
-            elif "Advanced" in item[0]:
-                icon = "🔍 "
-            elif "Titlovi.com" in item[0]:  # DODATO
-                icon = "🇷🇸 "  # Balkan ikonica
-            elif "Series" in item[0]:
-                icon = "📺 "
-            elif "File Explorer" in item[0]:
-                icon = "📁 "
-            elif "Configuration" in item[0]:
-                icon = "⚙️ "
-            elif "API" in item[0]:
-                icon = "🔑 "
-            elif "Clear Debug" in item[0]:
-                icon = "🗑️ "
-            elif "About" in item[0]:
-                icon = "ℹ️ "
-            elif "Exit" in item[0]:
-                icon = "🚪 "
-            
-            list_items.append((f"{idx+1}. {icon}{item[0]}", item[1]))
-        self["menu"].setList(list_items)
+        # Stavke se ne menjaju - lista se ponovo postavlja samo ako je widget još nema,
+        # inače se samo vraća kursor na vrh kao posle setList
+        if self["menu"].list is not self.menu_list:
+            self["menu"].setList(self.menu_list)
+        else:
+            self["menu"].moveToIndex(0)
 
     def selectItem(self):
         """Plavo dugme - Select sa SVIM opcijama"""
@@ -5954,51 +6520,15 @@ class OpenSubtitlesMainScreen(Screen):
         if selected:
             action = selected[1]
 
-            if action == "search_standard":
-                self.session.open(OpenSubtitlesSearchScreen, self.plugin)
-            elif action == "search_smart":
-                self.session.open(OpenSubtitlesSmartSearchScreen, self.plugin)
-            elif action == "search_advanced":
-                self.session.open(OpenSubtitlesAdvancedSearchScreen, self.plugin)
-            elif action == "search_titlovi":  # DODATO
-                self.session.open(TitloviSearchScreen, self.plugin)  # KORISTI TitloviSearchScreen
-            elif action == "search_titlovi_advanced":  # DODATO
-                self.session.open(TitloviAdvancedSearchScreen, self.plugin)  # NOVO!
-            elif action == "search_series":
-                self.session.open(OpenSubtitlesSeriesSearchScreen, self.plugin)
-            elif action == "file_explorer":
-                self.session.open(SubtitleFileExplorer, self.plugin)
-            elif action == "config":
-                self.session.open(OpenSubtitlesConfigScreen, self.plugin)
-            elif action == "api_keys":
-                self.session.open(OpenSubtitlesApiKeysScreen, self.plugin)
-            elif action == "clear_debug":
-                self.clearDebugFiles()
-            elif action == "about":
-                about_text = f"""Ciefp Subtitles Plugin
-1. Standard Search (Film Name)
-   Simple and fast
-
-2. Smart Search (RECOMMENDED!)
-   Auto-tries: IMDB > File > Film
-   Shows which method worked
-
-3. Advanced Search (Film Name,File Name,IMDB ID)
-   Manual choice with arrows ↑ ↓
-
-4. Titlovi.com (NEW!)
-   Balkan languages ONLY
-   NO API key needed
-   Separate from other services
+            screen = self.SCREEN_ACTIONS.get(action)
+            if screen is not None:
+                self.session.open(screen, self.plugin)
+            elif action in self.METHOD_ACTIONS:
+                getattr(self, self.METHOD_ACTIONS[action])()
 
-SERVICES:
-• SubDL: Unlimited (API key)
-• OpenSubtitles: 5/day free
-• Titlovi.com: Free, Balkan only
-..:: CiefpSettings ::.."""
-                self.session.open(MessageBox, about_text, MessageBox.TYPE_INFO)
-            elif action == "exit":
-                self.close()
+    def showAbout(self):
+        """O pluginu"""
+        self.session.open(MessageBox, ABOUT_TEXT, MessageBox.TYPE_INFO)
 
 class OpenSubtitlesPlugin:
     """Glavna klasa plugina"""
@@ -6006,10 +6536,6 @@ class OpenSubtitlesPlugin:
     def __init__(self):
         self.api = SubtitlesAPI()
     
-    def main(self, session, **kwargs):
-        """Glavna funkcija plugina"""
-        session.open(OpenSubtitlesMainScreen, self)
-    
     def autoSearch(self, session, event, movie_title):
         """Automatska pretraga - koristi SMART search"""
         session.open(OpenSubtitlesSmartSearchScreen, self, movie_title)
@@ -6018,43 +6544,30 @@ class OpenSubtitlesPlugin:
         """Automatska STANDARD pretraga (za backward compatibility)"""
         session.open(OpenSubtitlesSearchScreen, self, movie_title)
     
-    def config(self, session, **kwargs):
-        """Konfiguracija"""
-        session.open(OpenSubtitlesConfigScreen, self)
-    
     def credits(self):
         """Informacije o pluginu"""
-        return [
-            ("Ciefp Subtitles", f"v{PLUGIN_VERSION}"),
-            ("Search Methods", "Standard, Smart, Advanced"),
-            ("Smart Search", "IMDB → File → Film (auto)"),
-            ("Best Results", "Use IMDB ID (tt1375666)")
-        ]
+        return CREDITS
 
 # Kreiranje instance plugina
 opensubtitles_plugin = OpenSubtitlesPlugin()
 
-# Funkcije za Enigma2
+# Funkcije za Enigma2 - ekran se otvara direktno, bez prolaska kroz metode plugina
 def main(session, **kwargs):
-    opensubtitles_plugin.main(session, **kwargs)
+    session.open(OpenSubtitlesMainScreen, opensubtitles_plugin)
 
 def config(session, **kwargs):
-    opensubtitles_plugin.config(session, **kwargs)
+    session.open(OpenSubtitlesConfigScreen, opensubtitles_plugin)
 
 def Plugins(**kwargs):
     """Registracija plugina u Enigma2"""
     from Plugins.Plugin import PluginDescriptor
     
-    icon_path = os.path.join(PLUGIN_PATH, "icon.png")
-    if not fileExists(icon_path):
-        icon_path = None
-    
     return [
         PluginDescriptor(
             name=f"CiefpSubtitles v{PLUGIN_VERSION}",
             description="Search and download subtitles (3 search methods)",
             where=PluginDescriptor.WHERE_PLUGINMENU,
-            icon=icon_path,
+            icon=ICON_PATH,
             fnc=main
         ),
         PluginDescriptor(
@@ -6063,4 +6576,4 @@ def Plugins(**kwargs):
             where=PluginDescriptor.WHERE_MOVIELIST,
             fnc=opensubtitles_plugin.autoSearch
         )
-    ]
\ No newline at end of file
+    ]